@@ -11,65 +11,214 @@ CHANGES:
 - Enhanced health checks with backend health information
 - Improved error handling and logging
 """
+import asyncio
+import logging
+import logging.handlers
 import os
+import queue
 import sys
 import time
 from typing import Any, Dict
 
-from fastapi import FastAPI, HTTPException
+import orjson
+from fastapi import FastAPI, HTTPException, Response
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, StreamingResponse
 
 # Add parent directory to path for shared imports
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from shared.models import CommandRequestModel
+
+from .backends.mavsdk import MAVSDKBackend
+from .executor import CommandExecutor
+from .telemetry_math import haversine_m
+from .telemetry_math import warm as warm_telemetry_math
+
+# Prefer uvloop when the app is started programmatically (e.g. a bare
+# `uvicorn agent.api:app`); agent/main.py also selects it explicitly
+try:
+    import uvloop
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    uvloop = None
+
+log = logging.getLogger("dronesphere.agent")
+log.setLevel(os.getenv("DRONESPHERE_LOG_LEVEL", "INFO").upper())
+log.propagate = False
+
+# Records are queued by the request handlers and written to stdout by the
+# listener thread, so logging never blocks the event loop on I/O
+_log_queue = queue.SimpleQueue()
+_console_handler = logging.StreamHandler(sys.stdout)
+_console_handler.setFormatter(
+    logging.Formatter("%(asctime)s [%(levelname)s] %(name)s: %(message)s")
+)
+log_listener = logging.handlers.QueueListener(_log_queue, _console_handler)
+log.addHandler(logging.handlers.QueueHandler(_log_queue))
+
 app = FastAPI(
     title="DroneSphere Agent",
     version="2.0.0",
     description="Drone control agent for individual drone operations",
+    default_response_class=ORJSONResponse,
 )
 
+# Streaming endpoints are sent uncompressed: gzip buffers the short NDJSON
+# lines, so clients would get results in blocks instead of one by one
+UNCOMPRESSED_PATHS = frozenset({"/commands/stream"})
+
+
+class StreamAwareGZipMiddleware(GZipMiddleware):
+    """GZip middleware that leaves UNCOMPRESSED_PATHS untouched."""
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] == "http" and scope["path"] in UNCOMPRESSED_PATHS:
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
+
+
+# Compress larger payloads (telemetry, detailed health) for polling clients
+app.add_middleware(StreamAwareGZipMiddleware, minimum_size=500)
+
 # Configuration
 AGENT_ID = 1  # TODO: Load from config file
 VERSION = "2.0.0"
 
+# Values that never change after startup, computed once for health responses
+PY_VER = sys.version.split()[0]
+PLATFORM = sys.platform
+AGENT_STATIC = {"version": VERSION, "id": AGENT_ID}
+
+# Pre-serialized fixed-shape fragments of the /health/detailed response; only
+# the dynamic values are encoded per request and spliced in between
+_DETAILED_AGENT_PREFIX = (
+    b'{"agent":' + orjson.dumps({"status": "ok", **AGENT_STATIC})[:-1] + b',"uptime":'
+)
+_DETAILED_SYSTEM = orjson.dumps({"python_version": PY_VER, "platform": PLATFORM})
+
 # Global state
 backend = None
 executor = None
-startup_time = time.time()
+backend_caps = {"has_health_check": False, "connection_string": None}
+telemetry_inflight = None
+reconnect_inflight = None
+# Uptime is measured on the monotonic clock; time.time() is only used for
+# wall-clock timestamps that clients consume
+STARTUP_NS = time.monotonic_ns()
+
+# Fixed 503 error messages; each request raises its own HTTPException, since
+# a shared instance would mix tracebacks and chaining across requests
+ERR_NO_EXECUTOR = "Command executor not initialized"
+ERR_NO_BACKEND = "Backend not initialized"
+ERR_RECONNECT_FAILED = "Backend not connected and reconnection failed"
 
 
 @app.on_event("startup")
 async def startup_event():
     """Initialize agent backend and executor on startup."""
-    global backend, executor
+    global backend, executor, backend_caps
+
+    log_listener.start()
 
     try:
-        print(f"Agent {AGENT_ID} starting up...")
-        # Import here to avoid circular imports
-        from .backends.mavsdk import MAVSDKBackend
-        from .executor import CommandExecutor
+        log.info("Agent %s starting up...", AGENT_ID)
 
         # Initialize MAVSDK backend with auto-detection        
         backend = MAVSDKBackend()  # Auto-detect connection        
 
+        # Compile the /telemetry distance math before requests arrive
+        warm_telemetry_math()
+
+        # The backend class is fixed from here on, so probe its optional
+        # capabilities once instead of on every /health/detailed request
+        backend_caps = {
+            "has_health_check": callable(getattr(backend, "health_check", None)),
+            "connection_string": getattr(backend, "_connection_string", None),
+        }
+
         # Try to connect to drone (non-blocking for health checks)
         try:
             connection_success = await backend.connect()
             if connection_success:
-                print("✅ MAVSDK backend connected")
+                log.info("✅ MAVSDK backend connected")
             else:
-                print("⚠️  MAVSDK connection failed - will retry on first request")
-                print("Backend created but not connected - health endpoints will show disconnected")
+                log.warning("⚠️  MAVSDK connection failed - will retry on first request")
+                log.warning("Backend created but not connected - health endpoints will show disconnected")
         except Exception as e:
-            print(f"⚠️  MAVSDK connection failed: {e}")
-            print("Backend created but not connected - health endpoints will show disconnected")
+            log.warning("⚠️  MAVSDK connection failed: %s", e)
+            log.warning("Backend created but not connected - health endpoints will show disconnected")
 
         # Initialize command executor
         executor = CommandExecutor(backend)
-        print("✅ Command executor initialized")
+        log.info("✅ Command executor initialized")
+
+    except Exception as e:
+        log.error("Startup error: %s", e)
+        log.error("Health endpoints will reflect initialization status")
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Flush queued log records."""
+    log_listener.stop()
+
+
+def _clear_telemetry_inflight(_future) -> None:
+    """Forget the finished shared telemetry fetch."""
+    global telemetry_inflight
+    telemetry_inflight = None
+
+
+async def _shared_telemetry() -> Dict[str, Any]:
+    """Fetch telemetry, sharing one backend call among concurrent requests.
+
+    Returns:
+        Telemetry dictionary from the backend (shared, do not mutate)
+    """
+    global telemetry_inflight
+
+    if telemetry_inflight is None:
+        telemetry_inflight = asyncio.ensure_future(backend.get_telemetry())
+        telemetry_inflight.add_done_callback(_clear_telemetry_inflight)
+
+    # Shield so a cancelled request does not cancel the fetch for the others
+    return await asyncio.shield(telemetry_inflight)
+
+
+def _clear_reconnect_inflight(_future) -> None:
+    """Forget the finished shared reconnection attempt."""
+    global reconnect_inflight
+    reconnect_inflight = None
 
+
+async def _ensure_connected() -> None:
+    """Reconnect the backend if needed, with at most one attempt in flight.
+
+    Requests that find the backend disconnected while a reconnection is
+    already running await that attempt instead of starting their own.
+
+    Raises:
+        HTTPException: 503 if the reconnection fails
+    """
+    global reconnect_inflight
+
+    if reconnect_inflight is None:
+        log.info("🔄 Backend disconnected, attempting reconnection...")
+        reconnect_inflight = asyncio.ensure_future(backend.connect())
+        reconnect_inflight.add_done_callback(_clear_reconnect_inflight)
+
+    try:
+        # Shield so a cancelled request does not abort the shared attempt
+        connection_success = await asyncio.shield(reconnect_inflight)
     except Exception as e:
-        print(f"Startup error: {e}")
-        print("Health endpoints will reflect initialization status")
+        raise HTTPException(status_code=503, detail=f"Backend connection failed: {str(e)}")
+
+    if not connection_success:
+        raise HTTPException(status_code=503, detail=ERR_RECONNECT_FAILED)
+    log.info("✅ Reconnection successful")
 
 
 @app.get("/health")
@@ -79,15 +228,14 @@ async def health_check() -> Dict[str, Any]:
     Returns:
         Health status with timestamp and agent info
     """
-    current_time = time.time()
-    uptime = current_time - startup_time
+    now = time.time()
 
     return {
         "status": "healthy",
-        "timestamp": current_time,
+        "timestamp": now,
         "agent_id": AGENT_ID,
         "version": VERSION,
-        "uptime_seconds": round(uptime, 2),
+        "uptime_seconds": round((time.monotonic_ns() - STARTUP_NS) * 1e-9, 2),
         "backend_connected": backend.connected if backend else False,
         "executor_ready": executor is not None,
     }
@@ -104,73 +252,66 @@ async def ping() -> Dict[str, float]:
 
 
 @app.get("/health/detailed")
-async def detailed_health() -> Dict[str, Any]:
+async def detailed_health() -> Response:
     """Detailed health check for debugging and monitoring.
 
     Returns:
         Comprehensive system status information
     """
+    now = time.time()
+
     # Get basic backend info
     backend_info = {
         "connected": backend.connected if backend else False,
         "type": "mavsdk" if backend else None,
-        "connection_string": getattr(backend, '_connection_string', None) if backend else None,
+        "connection_string": backend_caps["connection_string"],
     }
 
     # Try to get enhanced health info if available
-    if backend and hasattr(backend, 'health_check'):
+    if backend and backend_caps["has_health_check"]:
         try:
             backend_health = await backend.health_check()
             backend_info.update(backend_health)
         except Exception as e:
             backend_info["health_check_error"] = str(e)
 
-    return {
-        "agent": {
-            "status": "ok",
-            "version": VERSION,
-            "id": AGENT_ID,
-            "uptime": round(time.time() - startup_time, 2),
-        },
-        "backend": backend_info,
-        "executor": {
-            "available": executor is not None,
-            # "commands": list(executor.command_map.keys()) if executor else [],
-        },
-        "system": {"python_version": sys.version.split()[0], "platform": sys.platform},
-        "timestamp": time.time(),
+    executor_info = {
+        "available": executor is not None,
+        # "commands": list(executor.command_map.keys()) if executor else [],
     }
 
+    body = b"".join(
+        (
+            _DETAILED_AGENT_PREFIX,
+            orjson.dumps(round((time.monotonic_ns() - STARTUP_NS) * 1e-9, 2)),
+            b'},"backend":',
+            orjson.dumps(backend_info),
+            b',"executor":',
+            orjson.dumps(executor_info),
+            b',"system":',
+            _DETAILED_SYSTEM,
+            b',"timestamp":',
+            orjson.dumps(now),
+            b"}",
+        )
+    )
+    return Response(content=body, media_type="application/json")
+
 
 # Command execution endpoint
 @app.post("/commands")
-async def execute_commands(request: dict):
+async def execute_commands(req: CommandRequestModel):
     """Execute command sequence.
 
     Args:
-        request: Command request dictionary
+        req: Command request, validated by FastAPI against CommandRequestModel
 
     Returns:
         Execution results
     """
-    # Import here to avoid circular imports
-    from shared.models import Command, CommandMode, CommandRequest, QueueMode
-
     try:
-        # Parse request manually to handle dataclass conversion
-        commands_data = request.get("commands", [])
-        commands = []
-
-        for cmd_data in commands_data:
-            cmd = Command(
-                name=cmd_data["name"],
-                params=cmd_data.get("params", {}),
-                mode=CommandMode(cmd_data.get("mode", "continue")),
-            )
-            commands.append(cmd)
-
-        queue_mode = QueueMode(request.get("queue_mode", "override"))
-        target_drone = request.get("target_drone")
+        commands = req.commands
+        target_drone = req.target_drone
 
         # Validate target_drone
         if target_drone and target_drone != AGENT_ID:
@@ -185,54 +326,83 @@ async def execute_commands(request: dict):
 
         # Check if executor is ready
         if not executor:
-            raise HTTPException(status_code=503, detail="Command executor not initialized")
+            raise HTTPException(status_code=503, detail=ERR_NO_EXECUTOR)
 
         # Check backend connection before executing commands
-        if not backend or not backend.connected:
-            # Try to reconnect
-            if backend:
-                print("🔄 Backend disconnected, attempting reconnection...")
-                try:
-                    connection_success = await backend.connect()
-                    if not connection_success:
-                        raise HTTPException(
-                            status_code=503, detail="Backend not connected and reconnection failed"
-                        )
-                    print("✅ Reconnection successful")
-                except Exception as e:
-                    raise HTTPException(
-                        status_code=503, detail=f"Backend connection failed: {str(e)}"
-                    )
-            else:
-                raise HTTPException(status_code=503, detail="Backend not initialized")
-
-        # Execute commands
-        print(f"🎯 Received {len(commands)} commands for drone {target_drone}")
+        if not backend:
+            raise HTTPException(status_code=503, detail=ERR_NO_BACKEND)
+        if not backend.connected:
+            await _ensure_connected()
+
+        # The executor queues concurrent requests and runs them in order; a
+        # request cancelled before its turn is dropped from the queue
+        log.info("🎯 Received %d commands for drone %s", len(commands), target_drone)
         results = await executor.execute_sequence(commands)
 
-        return {
-            "success": all(r.success for r in results),
-            "results": [
-                {
-                    "success": r.success,
-                    "message": r.message,
-                    "error": r.error,
-                    "duration": r.duration,
-                }
-                for r in results
-            ],
-            "drone_id": AGENT_ID,
-            "timestamp": time.time(),
-            "total_commands": len(results),
-            "successful_commands": sum(1 for r in results if r.success),
-        }
-
+        # CommandResult is a dataclass, which orjson serializes natively;
+        # returning the response directly also skips jsonable_encoder, so
+        # counting the successes is the only pass made over the results here
+        n = len(results)
+        ok_count = 0
+        for r in results:
+            if r.success:
+                ok_count += 1
+        return ORJSONResponse(
+            {
+                "success": ok_count == n,
+                "results": results,
+                "drone_id": AGENT_ID,
+                "timestamp": time.time(),
+                "total_commands": n,
+                "successful_commands": ok_count,
+            }
+        )
+
+    except HTTPException:
+        raise
     except Exception as e:
-        print(f"Command execution error: {e}")
+        log.error("Command execution error: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.get("/telemetry")
+@app.post("/commands/stream")
+async def stream_commands(req: CommandRequestModel):
+    """Execute command sequence, streaming each result as it completes.
+
+    Same checks as /commands, but the response is NDJSON with one
+    CommandResult per line, written as soon as its command finishes.
+
+    Args:
+        req: Command request, validated by FastAPI against CommandRequestModel
+
+    Returns:
+        StreamingResponse: application/x-ndjson body of command results
+    """
+    target_drone = req.target_drone or AGENT_ID
+    if target_drone != AGENT_ID:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Wrong drone. This is drone {AGENT_ID}, got target {target_drone}",
+        )
+    if not executor:
+        raise HTTPException(status_code=503, detail=ERR_NO_EXECUTOR)
+    if not backend:
+        raise HTTPException(status_code=503, detail=ERR_NO_BACKEND)
+    if not backend.connected:
+        await _ensure_connected()
+
+    log.info("🎯 Streaming %d commands for drone %s", len(req.commands), target_drone)
+
+    async def ndjson():
+        # Goes through the executor queue directly rather than the batcher,
+        # which only hands back complete result lists
+        async for result in executor.execute_sequence_stream(req.commands):
+            yield orjson.dumps(result) + b"\n"
+
+    return StreamingResponse(ndjson(), media_type="application/x-ndjson")
+
+
+@app.get("/telemetry", response_class=ORJSONResponse)
 async def get_telemetry():
     """Get current drone telemetry data.
 
@@ -240,23 +410,31 @@ async def get_telemetry():
         Current telemetry information
     """
     if not backend:
-        raise HTTPException(status_code=503, detail="Backend not initialized")
+        raise HTTPException(status_code=503, detail=ERR_NO_BACKEND)
 
     if not backend.connected:
-        # Try to reconnect for telemetry requests
-        print("🔄 Backend disconnected for telemetry, attempting reconnection...")
-        try:
-            connection_success = await backend.connect()
-            if not connection_success:
-                raise HTTPException(
-                    status_code=503, detail="Backend not connected and reconnection failed"
-                )
-            print("✅ Reconnection successful for telemetry")
-        except Exception as e:
-            raise HTTPException(status_code=503, detail=f"Backend connection failed: {str(e)}")
+        await _ensure_connected()
 
     try:
-        telemetry = await backend.get_telemetry()
-        return {"drone_id": AGENT_ID, **telemetry}
+        telemetry = await _shared_telemetry()
+        response = {"drone_id": AGENT_ID, **telemetry}
+
+        # Derived value: horizontal distance from the PX4 origin
+        position = telemetry.get("position")
+        origin = telemetry.get("px4_origin")
+        if position and origin:
+            response["distance_from_origin"] = round(
+                haversine_m(
+                    origin["latitude"],
+                    origin["longitude"],
+                    position["latitude"],
+                    position["longitude"],
+                ),
+                2,
+            )
+
+        # Return the response directly so the float-heavy payload goes straight
+        # to orjson without a jsonable_encoder pass
+        return ORJSONResponse(response)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Telemetry error: {str(e)}")
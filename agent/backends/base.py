@@ -73,6 +73,10 @@ class DroneBackend(ABC):
     def connected(self) -> bool:
         """Check if backend is connected to drone.
 
+        Read on every API request, so implementations should return state
+        kept current by connect/disconnect and telemetry (MAVSDKBackend uses
+        a plain attribute) rather than performing RPCs or lookups here.
+
         Returns:
             bool: True if connected and receiving telemetry, False otherwise.
         """
@@ -11,12 +11,15 @@ FIXES:
 """
 import asyncio
 import logging
+import operator
 import os
-import subprocess
+import sys
 import time
-from dataclasses import dataclass, field
-from typing import Any, Dict, Optional, Set
+import weakref
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, NamedTuple, Optional, Tuple
 
+import orjson
 from mavsdk import System
 
 logger = logging.getLogger(__name__)
@@ -33,42 +36,159 @@ console_handler.setFormatter(formatter)
 # Attach handler to logger
 logger.addHandler(console_handler)
 
+# Reported as px4_origin until the first valid GPS fix sets the real origin
+DEFAULT_PX4_ORIGIN = {
+    "latitude": 47.3977505,  # Zurich default
+    "longitude": 8.5456072,
+    "altitude": 488.0,
+}
+
+
+def _telemetry_field(name: str) -> property:
+    """Build a property that marks the owning TelemetryState dirty on write."""
+    slot = "_" + name
+
+    def getter(self):
+        return getattr(self, slot)
+
+    def setter(self, value):
+        setattr(self, slot, value)
+        self._dirty = True
+
+    return property(getter, setter)
 
-@dataclass
-class TelemetryState:
-    """Thread-safe telemetry state container."""
 
-    position: Optional[Dict[str, float]] = None
-    attitude: Optional[Dict[str, float]] = None
-    battery: Optional[Dict[str, Any]] = None
-    flight_mode: Optional[str] = None
-    gps_info: Optional[Dict[str, Any]] = None
-    armed: Optional[bool] = None
-    connected: bool = False
-    timestamp: float = field(default_factory=time.time)
+class TelemetrySnapshot(NamedTuple):
+    """Latest armed state and relative altitude, replaced as a whole on update.
+
+    updated_at is the monotonic time of the position sample the altitude
+    came from.
+    """
+
+    armed: bool
+    relative_altitude_m: float
+    updated_at: float
+
+
+class TelemetryState:
+    """Telemetry state container with a cached dict view.
+
+    Writes to the sample fields mark the state dirty; to_dict() rebuilds the
+    dict only after such a write. connected and timestamp are plain slots
+    and are not part of the cached view.
+    """
+
+    CACHED_FIELDS = ("position", "attitude", "battery", "flight_mode", "gps_info", "armed")
+
+    __slots__ = tuple("_" + name for name in CACHED_FIELDS) + (
+        "connected",
+        "timestamp",
+        "_dirty",
+        "_cached_dict",
+    )
+
+    position = _telemetry_field("position")
+    attitude = _telemetry_field("attitude")
+    battery = _telemetry_field("battery")
+    flight_mode = _telemetry_field("flight_mode")
+    gps_info = _telemetry_field("gps_info")
+    armed = _telemetry_field("armed")
+
+    def __init__(self) -> None:
+        self._position: Optional[Dict[str, float]] = None
+        self._attitude: Optional[Dict[str, float]] = None
+        self._battery: Optional[Dict[str, Any]] = None
+        self._flight_mode: Optional[str] = None
+        self._gps_info: Optional[Dict[str, Any]] = None
+        self._armed: Optional[bool] = None
+        self.connected = False
+        self.timestamp = time.time()
+        self._dirty = True
+        self._cached_dict: Dict[str, Any] = {}
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dict, filtering None values."""
-        return {k: v for k, v in self.__dict__.items() if v is not None}
+        """Return the sample fields as a dict, filtering None values.
+
+        The returned dict is cached and shared between callers until the
+        next write, so it must not be mutated.
+        """
+        if self._dirty:
+            self._cached_dict = {
+                name: value
+                for name in self.CACHED_FIELDS
+                if (value := getattr(self, "_" + name)) is not None
+            }
+            self._dirty = False
+        return self._cached_dict
 
 
 class MAVSDKBackend:
     """MAVSDK backend for drone communication with robust error handling."""
 
+    # Instance attributes; class-level settings below stay shared class attributes
+    __slots__ = (
+        "drone",
+        "_connection_string",
+        "connected",
+        "_system_ready",
+        "_loop_ref",
+        "_telemetry_task",
+        "_tele_q",
+        "_shutdown_event",
+        "_telemetry_state",
+        "_px4_origin",
+        "_px4_origin_view",
+        "_px4_origin_cache",
+        "_origin_set",
+        "snapshot",
+    )
+
     # Default connection parameters
     DEFAULT_CONNECTION_TIMEOUT = 30.0
     DEFAULT_CHECK_INTERVAL = 0.5
 
+    # Seconds connect() waits for the autopilot to be discovered; unset or 0
+    # (the default) waits indefinitely, as slow-booting SITL and real
+    # airframes may need
+    AUTOPILOT_DISCOVERY_TIMEOUT: Optional[float] = (
+        float(os.getenv("DRONESPHERE_DISCOVERY_TIMEOUT") or 0) or None
+    )
+
+    # Docker Engine API used to detect bridge/SITL addresses
+    DOCKER_SOCKET = "/var/run/docker.sock"
+    DOCKER_API_TIMEOUT = 5.0
+
+    # Set once a warm-up RPC has gone through in this process
+    _warmed = False
+
+    # Bound on queued telemetry samples before producers wait on the consumer
+    TELEMETRY_QUEUE_SIZE = 256
+
+    # Seconds before a failed or ended telemetry stream is resubscribed
+    STREAM_RETRY_DELAY = 1.0
+
     # GPS fix type mapping for different MAVSDK versions
-    GPS_FIX_TYPES = {
-        0: "NO_GPS",
-        1: "NO_FIX",
-        2: "FIX_2D",
-        3: "FIX_3D",
-        4: "FIX_DGPS",
-        5: "RTK_FLOAT",
-        6: "RTK_FIXED",
-    }
+    # GPS fix type names indexed by fix value
+    GPS_FIX_TYPES = (
+        "NO_GPS",
+        "NO_FIX",
+        "FIX_2D",
+        "FIX_3D",
+        "FIX_DGPS",
+        "RTK_FLOAT",
+        "RTK_FIXED",
+    )
+
+    # Telemetry sample field getters (one C-level call per sample)
+    _POS_GET = operator.attrgetter(
+        "latitude_deg", "longitude_deg", "absolute_altitude_m", "relative_altitude_m"
+    )
+    _ATT_GET = operator.attrgetter("roll_deg", "pitch_deg", "yaw_deg")
+    _BAT_GET = operator.attrgetter("voltage_v", "remaining_percent")
+
+    # Optional GPS precision attributes (may not exist in all versions)
+    GPS_PRECISION_ATTRS = ("hdop", "vdop", "horizontal_accuracy_m", "vertical_accuracy_m")
+    _get_gps_precision = operator.attrgetter(*GPS_PRECISION_ATTRS)
 
     def __init__(self, connection_string: Optional[str] = None):
         """Initialize MAVSDK backend with smart connection detection.
@@ -80,39 +200,52 @@ class MAVSDKBackend:
         #self.drone = System(mavsdk_server_address="127.0.0.1", port=50051)
         self.drone = System(mavsdk_server_address="host.docker.internal", port=50051)
         #self.drone = System(mavsdk_server_address="10.180.100.241", port=50051)
-        # self._connection_string = connection_string or self._detect_connection_string() 
+        # self._connection_string = connection_string or await self._detect_connection_string() 
         self._connection_string = connection_string    
         self.connected = False
+        self._system_ready = False
+
+        # Loop the backend was created on, held weakly for the __del__ check
+        try:
+            self._loop_ref = weakref.ref(asyncio.get_running_loop())
+        except RuntimeError:
+            self._loop_ref = None
 
         # Task management
-        self._telemetry_tasks: Set[asyncio.Task] = set()
+        self._telemetry_task: Optional[asyncio.Task] = None
+        self._tele_q: Optional[asyncio.Queue] = None
         self._shutdown_event = asyncio.Event()
 
         # Telemetry state
         self._telemetry_state = TelemetryState()
         self._px4_origin: Optional[Dict[str, float]] = None
+        self._px4_origin_view: Optional[Mapping[str, float]] = None
+        # GPS global origin fetched by goto: (lat, lon, alt, monotonic cached_at)
+        self._px4_origin_cache: Optional[Tuple[float, float, float, float]] = None
         self._origin_set = False
+        # Flight state for command pre-checks, kept current by the telemetry task
+        self.snapshot: Optional[TelemetrySnapshot] = None
         #logger.info(f"🔧 MAVSDK Backend initialized with connection: {self._connection_string}")
 
-    def _detect_connection_string(self) -> str:  
+    async def _detect_connection_string(self) -> str:
         """Detect the appropriate connection string based on environment."""
         # Check for environment variable override
         if env_conn := os.getenv("MAVSDK_CONNECTION_STRING"):
-            logger.info(f"📡 Using env MAVSDK_CONNECTION_STRING: {env_conn}")
+            logger.info("📡 Using env MAVSDK_CONNECTION_STRING: %s", env_conn)
             return env_conn
 
         # Check if we're in Docker or if SITL container is running
-        docker_bridge_ip = self._get_docker_bridge_ip()
+        docker_bridge_ip = await self._get_docker_bridge_ip()
         if docker_bridge_ip:
             conn_str = f"udpin://{docker_bridge_ip}:14540"
-            logger.info(f"🐳 Detected Docker environment, using: {conn_str}")
+            logger.info("🐳 Detected Docker environment, using: %s", conn_str)
             return conn_str
 
         # Check if SITL container is running and get its IP
-        sitl_ip = self._get_sitl_container_ip()
+        sitl_ip = await self._get_sitl_container_ip()
         if sitl_ip:
             conn_str = f"udpin://{sitl_ip}:14540"
-            logger.info(f"🚁 Detected SITL container at: {conn_str}")
+            logger.info("🚁 Detected SITL container at: %s", conn_str)
             return conn_str
 
         # Default to localhost with new format
@@ -121,78 +254,82 @@ class MAVSDKBackend:
         #return "udpin://192.168.4.1:14550"
         return "udpin://0.0.0.0:14550"
 
-    def _get_docker_bridge_ip(self) -> Optional[str]:
+    async def _docker_get(self, path: str) -> Optional[Any]:
+        """GET a Docker Engine API path over the local Unix socket.
+
+        Uses HTTP/1.0 so the daemon replies with a plain (non-chunked) body
+        and closes the connection when done.
+
+        Args:
+            path: API path, e.g. "/networks/bridge"
+
+        Returns:
+            Optional[Any]: Decoded JSON body, or None on a non-200 response
+        """
+        reader, writer = await asyncio.wait_for(
+            asyncio.open_unix_connection(self.DOCKER_SOCKET), timeout=self.DOCKER_API_TIMEOUT
+        )
+        try:
+            writer.write(f"GET {path} HTTP/1.0\r\nHost: docker\r\n\r\n".encode())
+            await writer.drain()
+            raw = await asyncio.wait_for(reader.read(), timeout=self.DOCKER_API_TIMEOUT)
+        finally:
+            writer.close()
+            await writer.wait_closed()
+
+        head, _, body = raw.partition(b"\r\n\r\n")
+        status_line = head.split(b"\r\n", 1)[0].split()
+        if len(status_line) < 2 or status_line[1] != b"200":
+            return None
+        return orjson.loads(body)
+
+    async def _get_docker_bridge_ip(self) -> Optional[str]:
         """Get Docker bridge network IP if available."""
         try:
-            result = subprocess.run(
-                ["docker", "network", "inspect", "bridge"],
-                capture_output=True,
-                text=True,
-                timeout=5,
-            )
-            if result.returncode == 0:
-                import json
-
-                network_info = json.loads(result.stdout)
-                if network_info and len(network_info) > 0:
-                    gateway = network_info[0].get("IPAM", {}).get("Config", [{}])[0].get("Gateway")
-                    if gateway:
-                        logger.debug(f"Found Docker bridge gateway: {gateway}")
-                        return gateway
+            network_info = await self._docker_get("/networks/bridge")
+            if network_info:
+                gateway = network_info.get("IPAM", {}).get("Config", [{}])[0].get("Gateway")
+                if gateway:
+                    logger.debug("Found Docker bridge gateway: %s", gateway)
+                    return gateway
         except Exception as e:
-            logger.debug(f"Could not detect Docker bridge IP: {e}")
+            logger.debug("Could not detect Docker bridge IP: %s", e)
         return None
 
-    def _get_sitl_container_ip(self) -> Optional[str]:
+    async def _get_sitl_container_ip(self) -> Optional[str]:
         """Get SITL container IP if running."""
         try:
-            result = subprocess.run(
-                [
-                    "docker",
-                    "inspect",
-                    "-f",
-                    "{{range .NetworkSettings.Networks}}{{.IPAddress}}{{end}}",
-                    "dronesphere-sitl",
-                ],
-                capture_output=True,
-                text=True,
-                timeout=5,
-            )
-            if result.returncode == 0 and result.stdout.strip():
-                ip = result.stdout.strip()
-                logger.debug(f"Found SITL container IP: {ip}")
-                return ip
+            container_info = await self._docker_get("/containers/dronesphere-sitl/json")
+            if container_info:
+                networks = container_info.get("NetworkSettings", {}).get("Networks", {})
+                ip = "".join(net.get("IPAddress", "") for net in networks.values())
+                if ip:
+                    logger.debug("Found SITL container IP: %s", ip)
+                    return ip
         except Exception as e:
-            logger.debug(f"Could not get SITL container IP: {e}")
+            logger.debug("Could not get SITL container IP: %s", e)
         return None
 
-    def _check_port_availability(self, port: int) -> bool:
-        """Check if a port is available for binding."""
-        import socket
-
-        try:
-            with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
-                sock.bind(('', port))
-                return True
-        except OSError:
-            return False
-        
-
     async def connect(self) -> bool:
         logger.info("🔌 Connecting to MAVSDK server (waiting for autopilot)")
 
         try:
-            await asyncio.wait_for(
-                self.drone.connect(system_address="udp://127.0.0.1:14560"),
-                timeout=10.0
-            )
-
-            async for state in self.drone.core.connection_state():
-                if state.is_connected:
-                    logger.info("✅ Autopilot discovered via MAVSDK")
-                    self.connected = True
-                    await self._start_telemetry_collection()
-                    return True
+            # The System and its gRPC channel outlive disconnect(), so the
+            # plugin setup only runs on the first connect
+            if not self._system_ready:
+                await asyncio.wait_for(
+                    self.drone.connect(system_address="udp://127.0.0.1:14560"),
+                    timeout=10.0
+                )
+                self._system_ready = True
+
+            async with asyncio.timeout(self.AUTOPILOT_DISCOVERY_TIMEOUT):
+                async for state in self.drone.core.connection_state():
+                    if state.is_connected:
+                        logger.info("✅ Autopilot discovered via MAVSDK")
+                        self.connected = True
+                        await self._start_telemetry_collection()
+                        return True
 
         except asyncio.TimeoutError:
             logger.error("⏱️ Timed out waiting for autopilot (sysid ≠ 255)")
@@ -264,187 +401,275 @@ class MAVSDKBackend:
     #     return False
 
     async def _wait_for_connection(self, start_time: float) -> bool:
-        """Wait for drone connection with proper timeout handling."""
+        """Wait for drone connection with proper timeout handling.
+
+        Consumes a single connection_state() stream until it reports a
+        connection or the remaining time budget runs out.
+
+        Args:
+            start_time: time.monotonic() reading the budget is measured from
+        """
         timeout = min(15.0, self.DEFAULT_CONNECTION_TIMEOUT)  # Reduced timeout
+        remaining = timeout - (time.monotonic() - start_time)
+        if remaining <= 0:
+            return False
 
-        while time.time() - start_time < timeout:
-            try:
-                # Use timeout for each connection state check
-                async with asyncio.timeout(3.0):
-                    async for state in self.drone.core.connection_state():
-                        if state.is_connected:
-                            return True
-                        break  # Only check once per iteration
-
-                await asyncio.sleep(self.DEFAULT_CHECK_INTERVAL)
-
-            except asyncio.TimeoutError:
-                logger.debug("Connection state check timed out, retrying...")
-                continue
-            except Exception as e:
-                logger.warning(f"Error checking connection state: {e}")
-                await asyncio.sleep(self.DEFAULT_CHECK_INTERVAL)
+        states = self.drone.core.connection_state()
+        try:
+            async with asyncio.timeout(remaining):
+                async for state in states:
+                    if state.is_connected:
+                        return True
+        except asyncio.TimeoutError:
+            logger.debug("Timed out waiting for connection state")
+        except Exception as e:
+            logger.warning("Error checking connection state: %s", e)
+        finally:
+            await states.aclose()
 
         return False
 
     async def _start_telemetry_collection(self) -> None:
-        """Start all telemetry collection tasks with proper error handling."""
-        tasks = [
-            self._collect_position(),
-            self._collect_attitude(),
-            self._collect_battery(),
-            self._collect_flight_mode(),
-            self._collect_gps_info(),
-            self._collect_armed_state(),
-        ]
-
-        for coro in tasks:
-            task = asyncio.create_task(coro)
-            self._telemetry_tasks.add(task)
-            # Remove completed tasks
-            task.add_done_callback(self._telemetry_tasks.discard)
-
-        logger.info(f"📊 Started {len(tasks)} telemetry collection tasks")
+        """Start the telemetry supervisor task.
 
-    async def _collect_position(self) -> None:
-        """Collect position data with error handling and PX4 origin tracking."""
-        async for position in self.drone.telemetry.position():
-            try:
-                position_data = {
-                    "latitude": float(position.latitude_deg),
-                    "longitude": float(position.longitude_deg),
-                    "altitude": float(position.absolute_altitude_m),
-                    "relative_altitude": float(position.relative_altitude_m),
-                }
-
-                # Track PX4 origin (first valid GPS position)
-                if (
-                    not self._origin_set
-                    and position_data["latitude"] != 0
-                    and position_data["longitude"] != 0
-                ):
-                    self._px4_origin = {
-                        "latitude": position_data["latitude"],
-                        "longitude": position_data["longitude"],
-                        "altitude": position_data["altitude"],
-                    }
-                    self._origin_set = True
-                    logger.info(f"📍 PX4 origin set: {self._px4_origin}")
-
-                self._telemetry_state.position = position_data
+        A single supervisor runs one producer per MAVSDK stream plus one
+        consumer in a TaskGroup. Producers only enqueue raw samples; the
+        consumer drains the queue in batches and applies them to the
+        telemetry state, so the state is updated once per batch instead of
+        once per sample. Cancelling the supervisor tears down the group.
+        """
+        self._tele_q = asyncio.Queue(maxsize=self.TELEMETRY_QUEUE_SIZE)
+        self._telemetry_task = asyncio.create_task(self._run_telemetry())
 
-            except Exception as e:
-                logger.error(f"Error processing position data: {e}")
+        logger.info("📊 Started telemetry supervisor (6 streams, 1 consumer)")
+
+    async def _warmup(self) -> None:
+        """Issue one cheap unary RPC so the first real command skips the lazy setup."""
+        try:
+            await asyncio.wait_for(self.drone.info.get_version(), timeout=5.0)
+            MAVSDKBackend._warmed = True
+            logger.debug("gRPC channel warmed up")
+        except Exception as e:
+            logger.debug("gRPC warm-up skipped: %s", e)
+
+    async def _run_telemetry(self) -> None:
+        """Run all telemetry producers and the batching consumer together."""
+        try:
+            async with asyncio.TaskGroup() as tg:
+                tg.create_task(self._telemetry_consumer())
+                tg.create_task(self._collect_position())
+                tg.create_task(self._collect_attitude())
+                tg.create_task(self._collect_battery())
+                tg.create_task(self._collect_flight_mode())
+                tg.create_task(self._collect_gps_info())
+                tg.create_task(self._collect_armed_state())
+                if not MAVSDKBackend._warmed:
+                    tg.create_task(self._warmup())
+        except* Exception as eg:
+            # Streams restart themselves, so this is an unexpected failure;
+            # drop the connection so the next request reconnects (and with it
+            # restarts telemetry) instead of serving stale data
+            logger.error("Telemetry supervisor stopped: %s", eg.exceptions)
+            self.connected = False
+
+    async def _telemetry_consumer(self) -> None:
+        """Drain queued telemetry samples in batches and apply them."""
+        queue = self._tele_q
+        apply = {
+            "position": self._apply_position,
+            "attitude": self._apply_attitude,
+            "battery": self._apply_battery,
+            "flight_mode": self._apply_flight_mode,
+            "gps_info": self._apply_gps_info,
+            "armed": self._apply_armed_state,
+        }
+
+        while True:
+            batch = [await queue.get()]
+            while True:
+                try:
+                    batch.append(queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
 
-    async def _collect_attitude(self) -> None:
-        """Collect attitude data with error handling."""
-        async for attitude in self.drone.telemetry.attitude_euler():
             try:
-                self._telemetry_state.attitude = {
-                    "roll": float(attitude.roll_deg),
-                    "pitch": float(attitude.pitch_deg),
-                    "yaw": float(attitude.yaw_deg),
-                }
+                for field_name, sample in batch:
+                    apply[field_name](sample)
             except Exception as e:
-                logger.error(f"Error processing attitude data: {e}")
+                logger.error("Error processing telemetry batch: %s", e)
 
-    async def _collect_battery(self) -> None:
-        """Collect battery data with error handling."""
-        async for battery in self.drone.telemetry.battery():
+            self._telemetry_state.timestamp = time.time()
+
+    async def _forward(self, field_name: str, subscribe) -> None:
+        """Forward samples of one telemetry stream to the queue, resubscribing on failure.
+
+        A stream that raises or ends is logged and resubscribed on its own
+        after STREAM_RETRY_DELAY, so one bad stream neither stops the others
+        nor tears down the supervisor's TaskGroup.
+
+        Args:
+            field_name: Queue tag the consumer dispatches the samples on
+            subscribe: MAVSDK telemetry method returning the sample stream
+        """
+        put = self._tele_q.put
+        while True:
             try:
-                self._telemetry_state.battery = {
-                    "voltage": float(battery.voltage_v),
-                    "remaining_percent": float(battery.remaining_percent),
-                    # "remaining": float(battery.remaining_percent),
-                }
+                async for sample in subscribe():
+                    await put((field_name, sample))
+                logger.warning("Telemetry stream %s ended, resubscribing", field_name)
             except Exception as e:
-                logger.error(f"Error processing battery data: {e}")
+                logger.warning("Telemetry stream %s failed, resubscribing: %s", field_name, e)
+            await asyncio.sleep(self.STREAM_RETRY_DELAY)
+
+    async def _collect_position(self) -> None:
+        """Forward position samples to the telemetry queue."""
+        await self._forward("position", self.drone.telemetry.position)
+
+    async def _collect_attitude(self) -> None:
+        """Forward attitude samples to the telemetry queue."""
+        await self._forward("attitude", self.drone.telemetry.attitude_euler)
+
+    async def _collect_battery(self) -> None:
+        """Forward battery samples to the telemetry queue."""
+        await self._forward("battery", self.drone.telemetry.battery)
 
     async def _collect_flight_mode(self) -> None:
-        """Collect flight mode data with error handling."""
-        async for flight_mode in self.drone.telemetry.flight_mode():
-            try:
-                self._telemetry_state.flight_mode = str(flight_mode)
-            except Exception as e:
-                logger.error(f"Error processing flight mode data: {e}")
+        """Forward flight mode samples to the telemetry queue."""
+        await self._forward("flight_mode", self.drone.telemetry.flight_mode)
 
     async def _collect_gps_info(self) -> None:
-        """Collect GPS information with robust attribute handling."""
-        async for gps_info in self.drone.telemetry.gps_info():
-            try:
-                gps_data = {
-                    "num_satellites": getattr(gps_info, 'num_satellites', 0),
-                    "fix_type": self._get_fix_type_string(getattr(gps_info, 'fix_type', 0)),
-                }
+        """Forward GPS info samples to the telemetry queue."""
+        await self._forward("gps_info", self.drone.telemetry.gps_info)
 
-                # Optional precision attributes (may not exist in all versions)
-                for attr_name in ['hdop', 'vdop', 'horizontal_accuracy_m', 'vertical_accuracy_m']:
-                    if hasattr(gps_info, attr_name):
-                        value = getattr(gps_info, attr_name)
-                        if value is not None:
-                            gps_data[attr_name] = value
+    async def _collect_armed_state(self) -> None:
+        """Forward armed state samples to the telemetry queue."""
+        await self._forward("armed", self.drone.telemetry.armed)
+
+    def _apply_position(self, position) -> None:
+        """Apply a position sample and track the PX4 origin."""
+        # MAVSDK already delivers these fields as floats
+        lat, lon, alt, rel_alt = self._POS_GET(position)
+        position_data = {
+            "latitude": lat,
+            "longitude": lon,
+            "altitude": alt,
+            "relative_altitude": rel_alt,
+        }
+
+        # Track PX4 origin (first valid GPS position)
+        if not self._origin_set and lat != 0 and lon != 0:
+            self._px4_origin = {
+                "latitude": lat,
+                "longitude": lon,
+                "altitude": alt,
+            }
+            # The origin dict is never mutated once published; callers of
+            # get_px4_origin() get a read-only view of it
+            self._px4_origin_view = MappingProxyType(self._px4_origin)
+            self._origin_set = True
+            logger.info("📍 PX4 origin set: %s", self._px4_origin)
+
+        self._telemetry_state.position = position_data
+
+        armed = self._telemetry_state.armed
+        if armed is not None:
+            self.snapshot = TelemetrySnapshot(armed, rel_alt, time.monotonic())
+
+    def _apply_attitude(self, attitude) -> None:
+        """Apply an attitude sample."""
+        roll, pitch, yaw = self._ATT_GET(attitude)
+        self._telemetry_state.attitude = {
+            "roll": roll,
+            "pitch": pitch,
+            "yaw": yaw,
+        }
+
+    def _apply_battery(self, battery) -> None:
+        """Apply a battery sample."""
+        voltage, remaining = self._BAT_GET(battery)
+        self._telemetry_state.battery = {
+            "voltage": voltage,
+            "remaining_percent": remaining,
+        }
+
+    def _apply_flight_mode(self, flight_mode) -> None:
+        """Apply a flight mode sample."""
+        self._telemetry_state.flight_mode = str(flight_mode)
+
+    def _apply_gps_info(self, gps_info) -> None:
+        """Apply a GPS info sample with robust attribute handling."""
+        gps_data = {
+            "num_satellites": getattr(gps_info, 'num_satellites', 0),
+            "fix_type": self._get_fix_type_string(getattr(gps_info, 'fix_type', 0)),
+        }
+
+        # Fetch all precision attributes at once, one by one only if some are missing
+        try:
+            values = self._get_gps_precision(gps_info)
+        except AttributeError:
+            values = [getattr(gps_info, name, None) for name in self.GPS_PRECISION_ATTRS]
 
-                self._telemetry_state.gps_info = gps_data
+        for attr_name, value in zip(self.GPS_PRECISION_ATTRS, values):
+            if value is not None:
+                gps_data[attr_name] = value
 
-            except Exception as e:
-                logger.error(f"Error processing GPS info data: {e}")
+        self._telemetry_state.gps_info = gps_data
 
-    async def _collect_armed_state(self) -> None:
-        """Collect armed state with error handling."""
-        async for armed in self.drone.telemetry.armed():
-            try:
-                self._telemetry_state.armed = bool(armed)
-            except Exception as e:
-                logger.error(f"Error processing armed state data: {e}")
+    def _apply_armed_state(self, armed) -> None:
+        """Apply an armed state sample."""
+        armed = bool(armed)
+        # PX4 may move its global origin between flights; drop the cached one on disarm
+        if not armed and self._telemetry_state.armed:
+            self._px4_origin_cache = None
+        self._telemetry_state.armed = armed
+
+        snapshot = self.snapshot
+        if snapshot is not None and snapshot.armed != armed:
+            self.snapshot = snapshot._replace(armed=armed)
 
     def _get_fix_type_string(self, fix_type) -> str:
         """Convert GPS fix type to readable string with robust handling."""
+        # Handle different MAVSDK versions (enum with .value or plain int)
+        fix_value = getattr(fix_type, "value", fix_type)
         try:
-            # Handle different MAVSDK versions
-            if hasattr(fix_type, 'value'):
-                fix_value = fix_type.value
-            else:
-                fix_value = int(fix_type)
-
-            return self.GPS_FIX_TYPES.get(fix_value, f"UNKNOWN_{fix_value}")
-
-        except Exception as e:
-            logger.warning(f"Error converting fix type: {e}")
+            index = int(fix_value)
+        except (TypeError, ValueError):
             return str(fix_type)
 
+        if 0 <= index < len(self.GPS_FIX_TYPES):
+            return self.GPS_FIX_TYPES[index]
+        return f"UNKNOWN_{fix_value}"
+
     async def get_telemetry(self) -> Dict[str, Any]:
         """Get current telemetry data with connection status.
 
         Returns:
             dict: Current telemetry including all available data
         """
-        # Update connection status and timestamp
-        self._telemetry_state.connected = self.connected
-        self._telemetry_state.timestamp = time.time()
-
-        # Get base telemetry
-        telemetry = self._telemetry_state.to_dict()
-
-        # Add PX4 origin
-        if self._px4_origin:
-            telemetry["px4_origin"] = self._px4_origin.copy()
-        else:
-            # Provide default origin if not yet set
-            telemetry["px4_origin"] = {
-                "latitude": 47.3977505,  # Zurich default
-                "longitude": 8.5456072,
-                "altitude": 488.0,
-            }
+        state = self._telemetry_state
+        return {
+            **state.to_dict(),
+            "connected": self.connected,
+            "timestamp": state.timestamp,
+            # Plain dict (shared, not copied) so the payload stays JSON-serializable
+            "px4_origin": self._px4_origin or DEFAULT_PX4_ORIGIN,
+        }
+
+    async def get_telemetry_bytes(self) -> bytes:
+        """Get current telemetry already serialized as JSON.
 
-        return telemetry
+        Returns:
+            bytes: orjson-encoded telemetry, same content as get_telemetry()
+        """
+        return orjson.dumps(await self.get_telemetry())
 
-    async def get_px4_origin(self) -> Optional[Dict[str, float]]:
+    async def get_px4_origin(self) -> Optional[Mapping[str, float]]:
         """Get PX4 origin (first GPS fix position).
 
         Returns:
-            Optional[dict]: Origin with latitude, longitude, altitude or None
+            Optional[Mapping]: Read-only view of latitude, longitude, altitude or None
         """
-        return self._px4_origin.copy() if self._px4_origin else None
+        return self._px4_origin_view
 
     async def disconnect(self) -> None:
         """Cleanly disconnect from drone with proper cleanup."""
@@ -453,28 +678,38 @@ class MAVSDKBackend:
         # Signal shutdown to all collectors
         self._shutdown_event.set()
 
-        # Cancel all telemetry tasks
-        if self._telemetry_tasks:
-            for task in list(self._telemetry_tasks):
-                if not task.done():
-                    task.cancel()
-
-            # Wait for tasks to complete cancellation
-            if self._telemetry_tasks:
-                await asyncio.gather(*self._telemetry_tasks, return_exceptions=True)
+        # Cancel the telemetry supervisor (and with it every stream task)
+        task = self._telemetry_task
+        if task is not None:
+            if not task.done():
+                task.cancel()
 
-            self._telemetry_tasks.clear()
+            # Wait for the task group to finish cancellation
+            await asyncio.gather(task, return_exceptions=True)
+            self._telemetry_task = None
 
-        # Reset state
+        # Reset state (self.drone and its gRPC channel are kept for reconnects)
         self.connected = False
         self._telemetry_state = TelemetryState()
         self._px4_origin = None
+        self._px4_origin_view = None
+        self._px4_origin_cache = None
         self._origin_set = False
+        self.snapshot = None
         self._shutdown_event.clear()
 
         logger.info("🔌 Disconnected from drone")
 
     def __del__(self) -> None:
-        """Cleanup warning for proper resource management."""
-        if self._telemetry_tasks and not asyncio.get_event_loop().is_closed():
+        """Cleanup warning for proper resource management.
+
+        Never touches the event loop policy, so finalization cannot create
+        a new loop; the loop captured at construction is checked instead.
+        """
+        if sys.is_finalizing():
+            return
+
+        loop = self._loop_ref() if getattr(self, "_loop_ref", None) else None
+        task = getattr(self, "_telemetry_task", None)
+        if task is not None and not task.done() and loop is not None and not loop.is_closed():
             logger.warning("MAVSDKBackend deleted without proper disconnect() call")
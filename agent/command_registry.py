@@ -3,18 +3,86 @@
 Path: agent/command_registry.py
 Handles relative imports correctly.
 """
+import hashlib
 import importlib
-import inspect
+import importlib.util
+import json
 import logging
+import os
 import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Type
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
 
 import yaml
 from jsonschema import Draft7Validator
 
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
+
+# Prefer the libyaml C loader, fall back to the pure-Python one
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 logger = logging.getLogger(__name__)
 
+# Directory for the generated command table; kept outside the package so a
+# read-only install still works and the source tree stays clean
+REGISTRY_CACHE_DIR = Path(
+    os.getenv("DRONESPHERE_CACHE_DIR") or Path(tempfile.gettempdir()) / "dronesphere"
+)
+
+# Modules in commands_dir that hold shared code rather than a command
+NON_COMMAND_MODULES = frozenset({"base", "maneuvers"})
+
+# Upper bound on threads used to read and parse schema files
+SCHEMA_LOAD_WORKERS = 8
+
+# Validation results kept per (command name, params) pair; oldest dropped first
+VALIDATION_CACHE_SIZE = 512
+
+
+def _params_key(params: Dict[str, Any]) -> Any:
+    """Build a hashable cache key for a command's parameters.
+
+    Value types are part of the key so that e.g. True and 1, which compare
+    and hash equal, do not share a validation result. Params holding
+    unhashable values (lists, nested dicts) are keyed by their repr.
+
+    Args:
+        params: Command parameters
+
+    Returns:
+        Hashable key equal for identical params
+    """
+    key = tuple((name, type(value), value) for name, value in sorted(params.items()))
+    try:
+        hash(key)
+    except TypeError:
+        return repr(key)
+    return key
+
+
+def _parse_schema_file(schema_file: Path) -> Tuple[Path, Optional[Dict[str, Any]], Optional[Exception]]:
+    """Read and parse one YAML schema file.
+
+    Args:
+        schema_file: Path to the schema file
+
+    Returns:
+        Tuple of (path, parsed schema or None, error or None)
+    """
+    try:
+        with open(schema_file, 'r') as f:
+            return schema_file, yaml.load(f, Loader=SafeLoader), None
+    except Exception as e:
+        return schema_file, None, e
+
 
 class CommandRegistry:
     """Dynamic command discovery and registration system."""
@@ -39,7 +107,12 @@ class CommandRegistry:
 
         self.commands: Dict[str, Type] = {}
         self.schemas: Dict[str, Dict[str, Any]] = {}
-        self.validators: Dict[str, Draft7Validator] = {}
+        # Compiled fastjsonschema functions, or Draft7Validator instances
+        # when fastjsonschema is not installed
+        self.validators: Dict[str, Any] = {}
+        self._pkg_prefix: Optional[str] = None
+        self._info_cache: Optional[List[Dict[str, Any]]] = None
+        self._validation_cache: Dict[Tuple[str, Any], Tuple[str, ...]] = {}
 
         # Ensure paths are in sys.path for imports to work
         if str(project_root) not in sys.path:
@@ -54,20 +127,34 @@ class CommandRegistry:
     def discover_and_register(self) -> None:
         """Auto-discover and register all commands."""
         logger.info(f"🔍 Starting command discovery...")
+        self._info_cache = None
+        self._validation_cache.clear()
 
         # Discover Python command files using module imports (not file loading)
         if self.commands_dir.exists():
-            command_files = [
-                f for f in self.commands_dir.glob("*.py") if f.stem not in ["__init__", "base"]
-            ]
+            # Underscore-prefixed files (__init__, private helpers) are not commands
+            command_files = sorted(
+                f
+                for f in self.commands_dir.glob("*.py")
+                if not f.stem.startswith("_") and f.stem not in NON_COMMAND_MODULES
+            )
             logger.info(f"📁 Found {len(command_files)} command files")
 
-            for command_file in command_files:
-                command_name = command_file.stem
-                if self._load_command_module(command_name):
-                    logger.info(f"✅ Loaded command: {command_name}")
-                else:
-                    logger.warning(f"⚠️  Failed to load: {command_name}")
+            # Resolve the package name once instead of per module
+            self._pkg_prefix = self._resolve_package_prefix()
+            stamp = self._source_stamp()
+
+            if self._load_registry_cache(stamp):
+                logger.info(f"⚡ Loaded {len(self.commands)} commands from registry cache")
+            else:
+                for command_file in command_files:
+                    command_name = command_file.stem
+                    if self._load_command_module(command_name, command_file):
+                        logger.info(f"✅ Loaded command: {command_name}")
+                    else:
+                        logger.warning(f"⚠️  Failed to load: {command_name}")
+
+                self._write_registry_cache(stamp)
         else:
             logger.error(f"Commands directory not found: {self.commands_dir}")
 
@@ -78,42 +165,162 @@ class CommandRegistry:
             ]
             logger.info(f"📁 Found {len(schema_files)} schema files")
 
-            for schema_file in schema_files:
-                try:
-                    with open(schema_file, 'r') as f:
-                        schema_data = yaml.safe_load(f)
+            # File reads and parsing run concurrently; registration stays in order
+            with ThreadPoolExecutor(max_workers=SCHEMA_LOAD_WORKERS) as pool:
+                parsed = list(pool.map(_parse_schema_file, schema_files))
 
+            for schema_file, schema_data, error in parsed:
+                if error is not None:
+                    logger.error(f"Failed to load schema {schema_file}: {error}")
+                    continue
+
+                try:
                     if command_name := schema_data.get('name'):
                         self.schemas[command_name] = schema_data
-
-                        if 'validation_schema' in schema_data:
-                            self.validators[command_name] = Draft7Validator(
-                                schema_data['validation_schema']
-                            )
                         logger.info(f"📋 Loaded schema: {command_name}")
 
                 except Exception as e:
                     logger.error(f"Failed to load schema {schema_file}: {e}")
+
+            # Build validators once all schemas are parsed
+            for command_name, schema_data in self.schemas.items():
+                if 'validation_schema' in schema_data:
+                    try:
+                        self.validators[command_name] = self._compile_validator(
+                            schema_data['validation_schema']
+                        )
+                    except Exception as e:
+                        logger.error(f"Failed to build validator for {command_name}: {e}")
         else:
             logger.warning(f"Schemas directory not found: {self.schemas_dir}")
 
         logger.info(f"🚀 Registry ready: {len(self.commands)} commands, {len(self.schemas)} schemas")
 
-    def _load_command_module(self, command_name: str) -> bool:
-        """Load command class using proper module import.
+    def _source_stamp(self) -> str:
+        """Fingerprint the command sources the registry cache was built from.
+
+        Covers every module in commands_dir, not just the command files:
+        the shims re-export classes defined in shared modules such as
+        maneuvers.py, so editing those must invalidate the cache too.
+
+        Returns:
+            Hex digest over package prefix, file names, mtimes and sizes
+        """
+        digest = hashlib.sha1(f"{self._pkg_prefix}\n".encode())
+        for source_file in sorted(self.commands_dir.glob("*.py")):
+            st = source_file.stat()
+            digest.update(f"{source_file.name}:{st.st_mtime_ns}:{st.st_size}\n".encode())
+        return digest.hexdigest()
+
+    def _registry_cache_file(self) -> Path:
+        """Cache file for this commands_dir, so separate installs do not share one."""
+        key = hashlib.sha1(str(self.commands_dir.resolve()).encode()).hexdigest()[:16]
+        return REGISTRY_CACHE_DIR / f"registry-{key}.json"
+
+    def _load_registry_cache(self, stamp: str) -> bool:
+        """Register commands from the generated registry cache file.
+
+        Args:
+            stamp: Current source stamp; the cache is used only if it matches
+
+        Returns:
+            True if every cached command was registered
+        """
+        if self._pkg_prefix is None:
+            return False
+
+        try:
+            cache = json.loads(self._registry_cache_file().read_bytes())
+        except FileNotFoundError:
+            return False
+        except (OSError, ValueError) as e:
+            logger.warning(f"⚠️  Ignoring registry cache: {e}")
+            return False
+
+        if cache.get("source_stamp") != stamp:
+            logger.info("♻️  Registry cache is stale, rediscovering commands")
+            return False
+
+        try:
+            commands = {
+                name: getattr(importlib.import_module(module_path), class_name)
+                for name, (module_path, class_name) in cache["registry"].items()
+            }
+        except Exception as e:
+            logger.warning(f"⚠️  Ignoring registry cache: {e}")
+            return False
+
+        self.commands.update(commands)
+        return True
+
+    def _write_registry_cache(self, stamp: str) -> None:
+        """Write the discovered command table to the registry cache file.
+
+        Args:
+            stamp: Source stamp the table was built from
+        """
+        cache = {
+            "source_stamp": stamp,
+            "registry": {
+                name: [command_class.__module__, command_class.__name__]
+                for name, command_class in self.commands.items()
+            },
+        }
+
+        cache_file = self._registry_cache_file()
+        tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file.write_text(json.dumps(cache))
+            os.replace(tmp_file, cache_file)
+        except OSError as e:
+            logger.debug(f"Could not write registry cache: {e}")
+
+    def _resolve_package_prefix(self) -> Optional[str]:
+        """Find the importable package name for the commands directory.
+
+        Returns:
+            "commands" or "agent.commands", or None if neither imports
+        """
+        for prefix in ("commands", "agent.commands"):
+            try:
+                importlib.import_module(prefix)
+                return prefix
+            except ImportError:
+                continue
+        return None
+
+    def _load_command_module(self, command_name: str, command_file: Optional[Path] = None) -> bool:
+        """Load command class from its source file.
+
+        The module is registered under the package resolved once by
+        _resolve_package_prefix, so relative imports inside it keep working.
 
         Args:
             command_name: Name of the command
+            command_file: Path to the module (defaults to commands_dir/<name>.py)
 
         Returns:
             True if class was loaded successfully
         """
-        try:
-            # Use standard module import which handles relative imports correctly
-            module_path = f"commands.{command_name}"
+        if self._pkg_prefix is None:
+            logger.error(f"Cannot import {command_name}: commands package is not importable")
+            return False
 
-            # Import the module (this will handle relative imports properly)
-            module = importlib.import_module(module_path)
+        module_path = f"{self._pkg_prefix}.{command_name}"
+        command_file = command_file or self.commands_dir / f"{command_name}.py"
+
+        try:
+            module = sys.modules.get(module_path)
+            if module is None:
+                spec = importlib.util.spec_from_file_location(module_path, command_file)
+                module = importlib.util.module_from_spec(spec)
+                sys.modules[module_path] = module
+                try:
+                    spec.loader.exec_module(module)
+                except BaseException:
+                    del sys.modules[module_path]
+                    raise
 
             # Find the command class
             class_name = self._find_command_class(module, command_name)
@@ -125,22 +332,6 @@ class CommandRegistry:
                 logger.warning(f"No command class found in {module_path}")
                 return False
 
-        except ImportError as e:
-            # Try with agent prefix
-            try:
-                module_path = f"agent.commands.{command_name}"
-                module = importlib.import_module(module_path)
-
-                class_name = self._find_command_class(module, command_name)
-                if class_name:
-                    command_class = getattr(module, class_name)
-                    self.commands[command_name] = command_class
-                    return True
-
-            except ImportError as e2:
-                logger.error(f"Cannot import {command_name}: {e} / {e2}")
-                return False
-
         except Exception as e:
             logger.error(f"Error loading {command_name}: {e}")
             return False
@@ -175,18 +366,17 @@ class CommandRegistry:
             f"{command_name}Command",
         ]
 
-        # Check each possible name
+        # Check each possible name with direct lookups in the module namespace
+        mod_dict = vars(module)
         for name in possible_names:
-            if name and hasattr(module, name):
-                # Verify it's a class
-                obj = getattr(module, name)
-                if inspect.isclass(obj):
-                    return name
+            if name and isinstance(mod_dict.get(name), type):
+                return name
 
         # If no convention works, find any class ending with "Command" that's not BaseCommand
-        for name, obj in inspect.getmembers(module, inspect.isclass):
+        for name, obj in mod_dict.items():
             if (
-                name.endswith("Command")
+                isinstance(obj, type)
+                and name.endswith("Command")
                 and name != "BaseCommand"
                 and obj.__module__ == module.__name__
             ):
@@ -198,6 +388,9 @@ class CommandRegistry:
     def validate_params(self, command_name: str, params: Dict[str, Any]) -> List[str]:
         """Validate command parameters against schema.
 
+        Results are cached per (command name, params) pair, so commands
+        repeated within or across sequences are validated once.
+
         Args:
             command_name: Name of the command
             params: Parameters to validate
@@ -205,12 +398,44 @@ class CommandRegistry:
         Returns:
             List of validation error messages (empty if valid)
         """
-        if command_name not in self.validators:
+        validator = self.validators.get(command_name)
+        if validator is None:
             return []  # No validation schema defined
 
+        cache = self._validation_cache
+        key = (command_name, _params_key(params))
+        errors = cache.get(key)
+        if errors is None:
+            errors = tuple(self._run_validator(validator, params))
+            if len(cache) >= VALIDATION_CACHE_SIZE:
+                del cache[next(iter(cache))]
+            cache[key] = errors
+        return list(errors)
+
+    @staticmethod
+    def _run_validator(validator: Callable, params: Dict[str, Any]) -> List[str]:
+        """Run a compiled validator and collect its error messages.
+
+        Args:
+            validator: Validator built by _compile_validator
+            params: Parameters to validate
+
+        Returns:
+            List of validation error messages (empty if valid)
+        """
+        if fastjsonschema is not None:
+            try:
+                validator(params)
+                return []
+            except fastjsonschema.JsonSchemaValueException as e:
+                # Drop the leading "data" element fastjsonschema puts on every path
+                path = '.'.join(str(p) for p in e.path[1:]) or 'root'
+                return [f"{path}: {e.message}"]
+            except Exception as e:
+                return [f"Validation error: {str(e)}"]
+
         errors = []
         try:
-            validator = self.validators[command_name]
             for error in validator.iter_errors(params):
                 path = '.'.join(str(p) for p in error.path) if error.path else 'root'
                 errors.append(f"{path}: {error.message}")
@@ -219,6 +444,24 @@ class CommandRegistry:
 
         return errors
 
+    @staticmethod
+    def _compile_validator(validation_schema: Dict[str, Any]) -> Callable:
+        """Compile a validation schema into a validator.
+
+        Uses fastjsonschema code generation when available, otherwise a
+        Draft7Validator. Defaults are not applied, so validation never
+        modifies the params it checks.
+
+        Args:
+            validation_schema: JSON schema for the command parameters
+
+        Returns:
+            Compiled validator
+        """
+        if fastjsonschema is not None:
+            return fastjsonschema.compile(validation_schema, use_default=False)
+        return Draft7Validator(validation_schema)
+
     def get_command_class(self, command_name: str) -> Optional[Type]:
         """Get command class by name."""
         return self.commands.get(command_name)
@@ -227,12 +470,31 @@ class CommandRegistry:
         """Get command schema by name."""
         return self.schemas.get(command_name)
 
+    def warm(self) -> None:
+        """Run each registered command class's warm() hook once."""
+        for command_name, command_class in self.commands.items():
+            warm = getattr(command_class, "warm", None)
+            if warm is None:
+                continue
+            try:
+                warm()
+            except Exception as e:
+                logger.warning(f"⚠️  Warm-up failed for {command_name}: {e}")
+
     def list_commands(self) -> List[str]:
         """Get list of all registered command names."""
         return list(self.commands.keys())
 
     def get_command_info(self) -> List[Dict[str, Any]]:
-        """Get information about all registered commands."""
+        """Get information about all registered commands.
+
+        The result is derived only from discovery output, so it is built once
+        and cached until the next discover_and_register(). Callers must not
+        mutate it.
+        """
+        if self._info_cache is not None:
+            return self._info_cache
+
         info = []
         all_names = set(self.commands.keys()) | set(self.schemas.keys())
 
@@ -250,26 +512,24 @@ class CommandRegistry:
                 }
             )
 
+        self._info_cache = info
         return info
 
     def _extract_parameters(self, schema: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Extract parameter information from schema."""
-        params = []
         validation_schema = schema.get("validation_schema", {})
         properties = validation_schema.get("properties", {})
-        required = validation_schema.get("required", [])
-
-        for param_name, param_schema in properties.items():
-            params.append(
-                {
-                    "name": param_name,
-                    "type": param_schema.get("type", "any"),
-                    "required": param_name in required,
-                    "description": param_schema.get("description", ""),
-                    "default": param_schema.get("default"),
-                    "minimum": param_schema.get("minimum"),
-                    "maximum": param_schema.get("maximum"),
-                }
-            )
-
-        return params
+        required = set(validation_schema.get("required", ()))
+
+        return [
+            {
+                "name": param_name,
+                "type": param_schema.get("type", "any"),
+                "required": param_name in required,
+                "description": param_schema.get("description", ""),
+                "default": param_schema.get("default"),
+                "minimum": param_schema.get("minimum"),
+                "maximum": param_schema.get("maximum"),
+            }
+            for param_name, param_schema in properties.items()
+        ]
@@ -0,0 +1,68 @@
+"""Distance helpers shared by the movement commands.
+
+Path: agent/commands/_geo.py
+Built on agent/telemetry_math.py, which owns the haversine core and the
+optional numba compilation. The leading underscore keeps the command
+registry from loading this module.
+"""
+import math
+
+try:
+    from ..telemetry_math import EARTH_RADIUS_M, _jit, haversine_rad
+except ImportError:
+    # Loaded as the top-level "commands" package, with agent/ on sys.path
+    from telemetry_math import EARTH_RADIUS_M, _jit, haversine_rad
+
+# Meters per degree of latitude (arc length of one degree on the mean sphere)
+DEG2RAD_R = math.radians(1.0) * EARTH_RADIUS_M
+
+
+@_jit
+def distance_eq(lat1: float, lon1: float, alt1: float,
+                lat2: float, lon2: float, alt2: float,
+                cos_tgt_lat: float) -> float:
+    """Calculate 3D distance with the equirectangular approximation.
+
+    Only accurate close to the target (well under a centimeter within about
+    a kilometer); callers switch to distance_haversine farther out.
+
+    Args:
+        lat1: Current latitude in decimal degrees
+        lon1: Current longitude in decimal degrees
+        alt1: Current altitude in meters
+        lat2: Target latitude in decimal degrees
+        lon2: Target longitude in decimal degrees
+        alt2: Target altitude in meters
+        cos_tgt_lat: Cosine of the target latitude
+
+    Returns:
+        float: Distance in meters
+    """
+    north = (lat2 - lat1) * DEG2RAD_R
+    east = (lon2 - lon1) * DEG2RAD_R * cos_tgt_lat
+    up = alt2 - alt1
+    # numba's math.hypot takes exactly two arguments
+    return math.sqrt(north * north + east * east + up * up)
+
+
+@_jit
+def distance_haversine(lat1: float, lon1: float, alt1: float,
+                       lat2_rad: float, lon2_rad: float, alt2: float,
+                       cos_tgt_lat: float) -> float:
+    """Calculate 3D distance with the haversine formula for the horizontal part.
+
+    Args:
+        lat1: Current latitude in decimal degrees
+        lon1: Current longitude in decimal degrees
+        alt1: Current altitude in meters
+        lat2_rad: Target latitude in radians
+        lon2_rad: Target longitude in radians
+        alt2: Target altitude in meters
+        cos_tgt_lat: Cosine of the target latitude
+
+    Returns:
+        float: Distance in meters
+    """
+    horizontal_distance = haversine_rad(math.radians(lat1), math.radians(lon1),
+                                        lat2_rad, lon2_rad, cos_tgt_lat)
+    return math.hypot(horizontal_distance, alt2 - alt1)
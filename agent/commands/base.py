@@ -2,19 +2,103 @@
 
 Path: agent/commands/base.py
 """
+import asyncio
 import os
 import sys
+import time
 from abc import ABC, abstractmethod
-from typing import Any, Dict
+from typing import Any, AsyncIterator, Callable, Dict, Tuple
 
 # Add parent directory to path for shared imports
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
 from shared.models import CommandResult
 
+# Exact types JSON numbers decode to; params are checked with `type(x) in NUM_TYPES`
+# (an identity test, so bool is deliberately not accepted as a number)
+NUM_TYPES = (int, float)
+
+# Max age in seconds of the backend telemetry snapshot used by flight state checks
+SNAPSHOT_MAX_AGE = 1.0
+
+
+async def wait_for_telemetry(
+    stream: AsyncIterator[Any], predicate: Callable[[Any], bool], timeout: float
+) -> bool:
+    """Wait until a telemetry stream yields a sample matching predicate.
+
+    Args:
+        stream: MAVSDK telemetry stream (async generator)
+        predicate: Called with each sample; True ends the wait
+        timeout: Maximum wait in seconds
+
+    Returns:
+        bool: True if a matching sample arrived, False on timeout
+    """
+    try:
+        async with asyncio.timeout(timeout):
+            async for sample in stream:
+                if predicate(sample):
+                    return True
+    except TimeoutError:
+        pass
+    finally:
+        await stream.aclose()
+    return False
+
+
+async def first_samples(*streams: AsyncIterator[Any]) -> Tuple[Any, ...]:
+    """Read the first sample of several telemetry streams concurrently.
+
+    Args:
+        streams: MAVSDK telemetry streams (async generators)
+
+    Returns:
+        tuple: First sample of each stream, in argument order
+    """
+    try:
+        # Let every read finish before closing, then surface the first failure
+        samples = await asyncio.gather(*(anext(stream) for stream in streams), return_exceptions=True)
+    finally:
+        for stream in streams:
+            await stream.aclose()
+
+    for sample in samples:
+        if isinstance(sample, BaseException):
+            raise sample
+    return tuple(samples)
+
+
+async def read_flight_state(backend) -> Tuple[bool, float]:
+    """Get the armed state and relative altitude for a command pre-check.
+
+    Uses the backend's telemetry snapshot when it is fresh, so consecutive
+    commands need no new subscriptions, and reads one sample of each stream
+    otherwise.
+
+    Args:
+        backend: DroneBackend instance for communication
+
+    Returns:
+        tuple: (armed, relative altitude in meters)
+    """
+    snapshot = getattr(backend, "snapshot", None)
+    if snapshot is not None and time.monotonic() - snapshot.updated_at <= SNAPSHOT_MAX_AGE:
+        return snapshot.armed, snapshot.relative_altitude_m
+
+    telemetry = backend.drone.telemetry
+    is_armed, position = await first_samples(telemetry.armed(), telemetry.position())
+    return is_armed, position.relative_altitude_m
+
 
 class BaseCommand(ABC):
-    """Abstract base class for all drone commands."""
+    """Abstract base class for all drone commands.
+
+    Commands are slotted; subclasses declare their own __slots__ (empty if
+    they add no instance attributes).
+    """
+
+    __slots__ = ("name", "params")
 
     def __init__(self, name: str, params: Dict[str, Any]):
         """Initialize command with name and parameters.
@@ -31,6 +115,15 @@ class BaseCommand(ABC):
         """Validate command parameters. Override in subclasses."""
         pass
 
+    @classmethod
+    def warm(cls) -> None:
+        """Do one-time setup ahead of the first execution. Override in subclasses.
+
+        Called once per command class at agent startup, so first-call costs
+        (e.g. JIT compilation) are not paid while a command is in flight.
+        """
+        pass
+
     @abstractmethod
     async def execute(self, backend) -> CommandResult:
         """Execute the command using the provided backend.
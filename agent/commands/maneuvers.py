@@ -0,0 +1,801 @@
+"""Flight and timing command implementations.
+
+Path: agent/commands/maneuvers.py
+All six built-in commands live here; goto.py, land.py, rtl.py, takeoff.py,
+wait.py and yaw.py re-export their class so the registry (and older imports)
+keep finding them by command name.
+
+ROBUSTNESS:
+- takeoff only acts on the ground, land only when airborne
+- goto and yaw only operate when the drone is armed and airborne
+
+GOTO COORDINATE SYSTEMS:
+- GPS (lat/lon/alt): Altitude is ABSOLUTE MSL (Mean Sea Level) in meters
+- NED (north/east/down): Coordinates are RELATIVE to PX4 origin ground level
+
+USAGE:
+- GPS: {"latitude": 47.398, "longitude": 8.546, "altitude": 502.0}  # 502m MSL
+- NED: {"north": 50, "east": 30, "down": -15}  # 15m above origin ground level
+"""
+import asyncio
+import logging
+import math
+import time
+from typing import Tuple
+
+from mavsdk.telemetry import LandedState
+
+from shared.models import CommandResult
+
+from ._geo import distance_eq, distance_haversine
+from .base import NUM_TYPES, BaseCommand, first_samples, read_flight_state, wait_for_telemetry
+
+log = logging.getLogger(__name__)
+
+try:
+    import pymap3d as pm
+except ImportError:
+    pm = None
+    print("⚠️  pymap3d not available - NED coordinate conversion disabled")
+
+# Beyond this |dlat| + |dlon| (degrees, ~1 km) the flat-earth distance is not used
+EQUIRECT_MAX_DEG = 0.01
+
+# Coordinate system labels and the params that select them
+_COORD_GPS = "GPS"
+_COORD_NED = "NED"
+_GPS_KEYS = ("latitude", "longitude", "altitude")
+_NED_KEYS = ("north", "east", "down")
+
+# Seconds a fetched PX4 GPS origin is reused for NED conversion
+ORIGIN_CACHE_TTL = 60.0
+
+
+class GotoCommand(BaseCommand):
+    """Navigate to specified GPS or NED coordinates.
+
+    Coordinate Systems:
+    1. GPS: {"latitude": float, "longitude": float, "altitude": float}
+       - latitude/longitude: Decimal degrees
+       - altitude: ABSOLUTE MSL altitude in meters
+
+    2. NED: {"north": float, "east": float, "down": float}
+       - Coordinates RELATIVE to PX4 origin ground level
+       - north/east: Horizontal displacement in meters
+       - down: Vertical displacement (negative = up from origin)
+
+    Optional Parameters:
+        - speed: Flight speed in m/s (default: 5.0, max: 20.0)
+        - acceptance_radius: Arrival tolerance in meters (default: 2.0, max: 50.0)
+
+    Robustness: Requires drone to be armed and airborne.
+    """
+
+    # Target position and trig terms cached by _set_target
+    __slots__ = (
+        "_tgt_lat",
+        "_tgt_lon",
+        "_tgt_lat_rad",
+        "_tgt_lon_rad",
+        "_tgt_cos_lat",
+        "_tgt_alt",
+    )
+
+    # (param, min, max, error message) for each coordinate system
+    _GPS_SPEC = (
+        ("latitude", -90, 90, "latitude must be a number between -90 and 90 degrees"),
+        ("longitude", -180, 180, "longitude must be a number between -180 and 180 degrees"),
+        ("altitude", -500, 10000, "altitude must be between -500 and 10000 meters MSL"),
+    )
+    _NED_SPEC = (
+        ("north", -10000, 10000, "north must be a number with absolute value ≤ 10000 meters"),
+        ("east", -10000, 10000, "east must be a number with absolute value ≤ 10000 meters"),
+        ("down", -1000, 100, "down must be between -1000 and 100 meters (negative = up)"),
+    )
+
+    @classmethod
+    def warm(cls) -> None:
+        """Compile the distance helpers (a no-op without numba)."""
+        distance_eq(0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 1.0)
+        distance_haversine(0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 1.0)
+
+    def validate_params(self) -> None:
+        """Validate command parameters for GPS or NED coordinates."""
+        params = self.params
+
+        # Check coordinate system
+        has_gps = all(key in params for key in _GPS_KEYS)
+        has_ned = all(key in params for key in _NED_KEYS)
+
+        # Exactly one coordinate system must be given
+        if has_gps == has_ned:
+            if has_gps:
+                raise ValueError("goto cannot accept both GPS and NED coordinates simultaneously")
+            raise ValueError(
+                "goto requires either GPS coordinates (latitude, longitude, altitude) "
+                "or NED coordinates (north, east, down)"
+            )
+
+        if has_gps:
+            self._validate_gps_params()
+        else:
+            self._validate_ned_params()
+
+        # Validate optional parameters
+        if "speed" in params:
+            speed = params["speed"]
+            if type(speed) not in NUM_TYPES or speed <= 0 or speed > 20:
+                raise ValueError("speed must be a positive number ≤ 20 m/s")
+
+        if "acceptance_radius" in params:
+            radius = params["acceptance_radius"]
+            if type(radius) not in NUM_TYPES or radius <= 0 or radius > 50:
+                raise ValueError("acceptance_radius must be positive and ≤ 50 meters")
+
+    def _validate_gps_params(self) -> None:
+        """Validate GPS coordinate parameters."""
+        self._validate_spec(self._GPS_SPEC)
+
+    def _validate_ned_params(self) -> None:
+        """Validate NED coordinate parameters."""
+        if pm is None:
+            raise ValueError("NED coordinates require pymap3d library (uv pip install pymap3d)")
+
+        self._validate_spec(self._NED_SPEC)
+
+    def _validate_spec(self, spec: Tuple[Tuple[str, float, float, str], ...]) -> None:
+        """Check each (name, low, high, message) entry of a spec table.
+
+        Raises:
+            ValueError: With the entry's message if a value is not a number in [low, high]
+        """
+        params = self.params
+        for name, low, high, message in spec:
+            value = params[name]
+            if type(value) not in NUM_TYPES or not (low <= value <= high):
+                raise ValueError(message)
+
+    async def _check_flight_state(self, backend) -> None:
+        """Check if drone is in appropriate state for goto command.
+
+        Raises:
+            RuntimeError: If drone is not armed or not airborne
+        """
+        is_armed, relative_altitude = await read_flight_state(backend)
+
+        # Check if armed
+        if not is_armed:
+            raise RuntimeError("goto command requires drone to be armed. Use takeoff first.")
+
+        # Check if airborne (relative altitude > 0.5m)
+        if relative_altitude < 0.5:
+            raise RuntimeError("goto command requires drone to be airborne. Use takeoff first.")
+
+    async def _get_px4_origin_dynamic(self, backend) -> Tuple[float, float, float]:
+        """Get PX4 origin GPS coordinates dynamically from telemetry.
+
+        The origin is cached on the backend for ORIGIN_CACHE_TTL seconds (the
+        backend clears it on disarm), so consecutive NED waypoints share one
+        RPC.
+
+        Returns:
+            tuple: (latitude, longitude, altitude) of PX4 origin
+        """
+        cached = getattr(backend, "_px4_origin_cache", None)
+        if cached is not None and time.monotonic() - cached[3] < ORIGIN_CACHE_TTL:
+            return cached[:3]
+
+        try:
+            origin = await backend.drone.telemetry.get_gps_global_origin()
+            backend._px4_origin_cache = (
+                origin.latitude_deg,
+                origin.longitude_deg,
+                origin.altitude_m,
+                time.monotonic(),
+            )
+            return (origin.latitude_deg, origin.longitude_deg, origin.altitude_m)
+        except Exception as e:
+            print(f"⚠️  Could not get GPS origin from PX4: {e}")
+            print("🔧 Using SITL default origin (Zurich)")
+            return (47.3977508, 8.5456074, 488.0)
+
+    async def _convert_ned_to_gps(
+        self, backend, north: float, east: float, down: float
+    ) -> Tuple[float, float, float]:
+        """Convert NED coordinates to GPS using dynamic PX4 origin.
+
+        NED coordinates are RELATIVE to origin ground level.
+
+        Args:
+            north: North displacement in meters from origin
+            east: East displacement in meters from origin
+            down: Down displacement in meters (negative = up from origin ground level)
+
+        Returns:
+            tuple: (latitude, longitude, altitude_msl) in GPS coordinates
+        """
+        if pm is None:
+            raise RuntimeError("pymap3d library required for NED conversion")
+
+        # Get dynamic PX4 origin coordinates
+        origin_lat, origin_lon, origin_alt_msl = await self._get_px4_origin_dynamic(backend)
+
+        print(f"📍 Using PX4 origin: {origin_lat:.6f}, {origin_lon:.6f}, {origin_alt_msl:.1f}m MSL")
+
+        # Convert NED to GPS using pymap3d
+        # Note: pymap3d converts relative to the origin altitude
+        target_lat, target_lon, target_alt_msl = pm.ned2geodetic(
+            north, east, down, origin_lat, origin_lon, origin_alt_msl
+        )
+
+        return (target_lat, target_lon, target_alt_msl)
+
+    async def execute(self, backend) -> CommandResult:
+        """Execute goto command using MAVSDK backend."""
+        start_time = time.monotonic()
+        params = self.params
+
+        try:
+            if not backend.connected:
+                return CommandResult(
+                    success=False,
+                    message="Backend not connected to drone",
+                    error="backend_disconnected",
+                )
+
+            drone = backend.drone
+
+            # Get target coordinates based on coordinate system
+            if "latitude" in params:
+                # Check flight state - must be armed and airborne
+                await self._check_flight_state(backend)
+
+                # GPS coordinates - altitude is ABSOLUTE MSL
+                target_lat = params["latitude"]
+                target_lon = params["longitude"]
+                target_alt_msl = params["altitude"]  # Already MSL
+                coord_type = _COORD_GPS
+
+                print(f"🔧 Executing goto to {coord_type} coordinates...")
+                print(f"   📍 Target: {target_lat:.6f}, {target_lon:.6f}")
+                print(f"   🏔️  Altitude: {target_alt_msl:.1f}m MSL (absolute)")
+
+            else:
+                # NED coordinates - relative to origin ground level. The flight
+                # state check and the origin lookup are independent RPCs, so
+                # run them concurrently and report the state error first.
+                state_error, target = await asyncio.gather(
+                    self._check_flight_state(backend),
+                    self._convert_ned_to_gps(
+                        backend, params["north"], params["east"], params["down"]
+                    ),
+                    return_exceptions=True,
+                )
+                for outcome in (state_error, target):
+                    if isinstance(outcome, BaseException):
+                        raise outcome
+                target_lat, target_lon, target_alt_msl = target
+                coord_type = _COORD_NED
+
+                print(f"🔧 Executing goto to {coord_type} coordinates...")
+                print(f"   📍 Target: {target_lat:.6f}, {target_lon:.6f}")
+                print(f"   🏔️  Altitude: {target_alt_msl:.1f}m MSL (from NED conversion)")
+                print(
+                    f"   📊 NED: N={params['north']}m, E={params['east']}m, D={params['down']}m"
+                )
+
+            # Get optional parameters
+            speed = params.get("speed", 5.0)
+            acceptance_radius = params.get("acceptance_radius", 2.0)
+
+            print(f"   ⚡ Speed: {speed}m/s, Acceptance: {acceptance_radius}m")
+
+            # Execute goto using MAVSDK action.goto_location with MSL altitude
+            await drone.action.goto_location(
+                target_lat, target_lon, target_alt_msl, float("nan")  # Maintain current yaw
+            )
+
+            print(f"🚁 Navigate command sent, monitoring arrival...")
+
+            # Target is fixed for the whole goto; precompute its trig once
+            self._set_target(target_lat, target_lon, target_alt_msl)
+
+            # Monitor arrival on a single position stream with timeout
+            timeout = 60.0
+            log_interval = 5.0
+            next_log = time.monotonic()
+
+            distance_to_target = self._distance_to_target_fast
+            positions = drone.telemetry.position()
+            try:
+                async with asyncio.timeout(timeout):
+                    async for position in positions:
+                        # Calculate 3D distance to target
+                        distance = distance_to_target(
+                            position.latitude_deg,
+                            position.longitude_deg,
+                            position.absolute_altitude_m,
+                        )
+
+                        if distance <= acceptance_radius:
+                            duration = time.monotonic() - start_time
+                            return CommandResult(
+                                success=True,
+                                message=f"goto to {coord_type} coordinates completed successfully (distance: {distance:.1f}m)",
+                                duration=duration,
+                            )
+
+                        # Log progress every 5 seconds
+                        now = time.monotonic()
+                        if now >= next_log:
+                            log.debug("📊 Distance to target: %.1fm", distance)
+                            next_log = now + log_interval
+            except TimeoutError:
+                pass
+            finally:
+                await positions.aclose()
+
+            # Timeout reached
+            duration = time.monotonic() - start_time
+            return CommandResult(
+                success=False,
+                message=f"goto to {coord_type} coordinates timed out after {timeout}s",
+                error="timeout",
+                duration=duration,
+            )
+
+        except Exception as e:
+            duration = time.monotonic() - start_time
+            return CommandResult(
+                success=False, message=f"goto failed: {str(e)}", error=str(e), duration=duration
+            )
+
+    def _set_target(self, lat: float, lon: float, alt: float) -> None:
+        """Cache the target position and its trig terms for distance checks.
+
+        Args:
+            lat: Target latitude in decimal degrees
+            lon: Target longitude in decimal degrees
+            alt: Target altitude in meters MSL
+        """
+        # JSON params may be ints; numba compiles a separate specialization
+        # per argument type, and warm() only prepares the float one
+        lat = float(lat)
+        lon = float(lon)
+        self._tgt_lat = lat
+        self._tgt_lon = lon
+        self._tgt_lat_rad = math.radians(lat)
+        self._tgt_lon_rad = math.radians(lon)
+        self._tgt_cos_lat = math.cos(self._tgt_lat_rad)
+        self._tgt_alt = float(alt)
+
+    def _distance_to_target_fast(self, lat1: float, lon1: float, alt1: float) -> float:
+        """Calculate 3D distance to the cached target, cheaply when close.
+
+        Within EQUIRECT_MAX_DEG of the target the equirectangular
+        approximation is accurate to well under a centimeter, which is all
+        the arrival check needs; farther away it defers to haversine.
+
+        Returns:
+            float: Distance in meters
+        """
+        lat2 = self._tgt_lat
+        lon2 = self._tgt_lon
+        if abs(lat2 - lat1) + abs(lon2 - lon1) > EQUIRECT_MAX_DEG:
+            return self._distance_to_target(lat1, lon1, alt1)
+        return distance_eq(lat1, lon1, alt1, lat2, lon2, self._tgt_alt, self._tgt_cos_lat)
+
+    def _distance_to_target(self, lat1: float, lon1: float, alt1: float) -> float:
+        """Calculate 3D distance from a GPS coordinate to the cached target.
+
+        Returns:
+            float: Distance in meters
+        """
+        return distance_haversine(lat1, lon1, alt1, self._tgt_lat_rad, self._tgt_lon_rad,
+                                  self._tgt_alt, self._tgt_cos_lat)
+
+
+class LandCommand(BaseCommand):
+    """Land the drone at current location.
+
+    No parameters required.
+
+    Robustness: Only works when drone is airborne (relative altitude > 0.5m).
+    If already on ground, returns informational message without action.
+    """
+
+    __slots__ = ()
+
+    def validate_params(self) -> None:
+        """Validate land parameters (none required)."""
+        # Land command takes no parameters
+        pass
+
+    async def _check_airborne_state(self, backend) -> bool:
+        """Check if drone is airborne.
+
+        Returns:
+            bool: True if airborne (relative altitude > 0.5m), False if on ground
+        """
+        # One sample, with the subscription closed right after it
+        (position,) = await first_samples(backend.drone.telemetry.position())
+        relative_alt = position.relative_altitude_m
+
+        print(f"📊 Current relative altitude: {relative_alt:.2f}m")
+        return relative_alt > 0.5
+
+    async def execute(self, backend) -> CommandResult:
+        """Execute land using MAVSDK backend."""
+        start_time = time.monotonic()
+
+        try:
+            if not backend.connected:
+                return CommandResult(
+                    success=False,
+                    message="Backend not connected to drone",
+                    error="backend_disconnected",
+                )
+
+            # Check if airborne
+            is_airborne = await self._check_airborne_state(backend)
+
+            if not is_airborne:
+                # Already on ground - return success without action
+                duration = time.monotonic() - start_time
+                return CommandResult(
+                    success=True,
+                    message=f"Drone already on ground - landing not needed",
+                    duration=duration,
+                )
+
+            print("🛬 Executing landing...")
+
+            # Get MAVSDK drone instance
+            drone = backend.drone
+
+            # Execute landing
+            await drone.action.land()
+
+            # Wait for landing completion (on ground, at most 10s)
+            landed = await wait_for_telemetry(
+                drone.telemetry.landed_state(),
+                lambda state: state == LandedState.ON_GROUND,
+                timeout=10.0,
+            )
+            if not landed:
+                print("⏱️  Not yet on ground after 10s")
+
+            duration = time.monotonic() - start_time
+
+            print(f"✅ Landing completed in {duration:.1f}s")
+            return CommandResult(
+                success=True, message="Landing completed successfully", duration=duration
+            )
+
+        except Exception as e:
+            duration = time.monotonic() - start_time
+            return CommandResult(
+                success=False, message=f"Landing failed: {str(e)}", error=str(e), duration=duration
+            )
+
+
+class RTLCommand(BaseCommand):
+    """Return to launch position and land."""
+
+    __slots__ = ()
+
+    def validate_params(self) -> None:
+        """RTL command has no parameters to validate."""
+        pass
+
+    async def execute(self, backend) -> CommandResult:
+        """Execute RTL using MAVSDK backend."""
+        start_time = time.monotonic()
+
+        try:
+            if not backend.connected:
+                return CommandResult(
+                    success=False,
+                    message="Backend not connected to drone",
+                    error="backend_disconnected",
+                )
+
+            print("🏠 Executing Return to Launch...")
+
+            # Get MAVSDK drone instance
+            drone = backend.drone
+
+            # Execute RTL
+            await drone.action.return_to_launch()
+
+            # Wait for RTL completion (landed at home, at most 15s)
+            landed = await wait_for_telemetry(
+                drone.telemetry.landed_state(),
+                lambda state: state == LandedState.ON_GROUND,
+                timeout=15.0,
+            )
+            if not landed:
+                print("⏱️  RTL still in progress after 15s")
+
+            duration = time.monotonic() - start_time
+
+            print(f"✅ RTL completed in {duration:.1f}s")
+            return CommandResult(
+                success=True, message="Return to launch completed successfully", duration=duration
+            )
+
+        except Exception as e:
+            duration = time.monotonic() - start_time
+            error_msg = str(e)
+            print(f"❌ RTL failed: {error_msg}")
+
+            return CommandResult(
+                success=False,
+                message=f"RTL failed: {error_msg}",
+                error=error_msg,
+                duration=duration,
+            )
+
+
+class TakeoffCommand(BaseCommand):
+    """Takeoff to specified altitude.
+
+    Parameters:
+        - altitude: Target altitude in meters (1.0 to 50.0, default: 10.0)
+
+    Robustness: Only works when drone is on ground (relative altitude < 0.5m).
+    If already airborne, returns informational message without action.
+    """
+
+    __slots__ = ()
+
+    def validate_params(self) -> None:
+        """Validate takeoff parameters."""
+        altitude = self.params.get("altitude", 10.0)
+
+        if type(altitude) not in NUM_TYPES:
+            raise ValueError("altitude must be a number")
+
+        if not 1.0 <= altitude <= 50.0:
+            raise ValueError(f"altitude must be between 1-50m, got {altitude}m")
+
+    async def _check_ground_state(self, backend) -> bool:
+        """Check if drone is on ground.
+
+        Returns:
+            bool: True if on ground (relative altitude < 0.5m), False if airborne
+        """
+        # One sample, with the subscription closed right after it
+        (position,) = await first_samples(backend.drone.telemetry.position())
+        relative_alt = position.relative_altitude_m
+
+        print(f"📊 Current relative altitude: {relative_alt:.2f}m")
+        return relative_alt < 0.5
+
+    async def execute(self, backend) -> CommandResult:
+        """Execute takeoff using MAVSDK backend."""
+        start_time = time.monotonic()
+
+        try:
+            if not backend.connected:
+                return CommandResult(
+                    success=False,
+                    message="Backend not connected to drone",
+                    error="backend_disconnected",
+                )
+
+            altitude = float(self.params.get("altitude", 10.0))
+
+            # Check if already airborne
+            is_on_ground = await self._check_ground_state(backend)
+
+            if not is_on_ground:
+                # Already airborne - return success without action
+                duration = time.monotonic() - start_time
+                return CommandResult(
+                    success=True,
+                    message=f"Drone already airborne - takeoff not needed",
+                    duration=duration,
+                )
+
+            print(f"🚁 Executing takeoff to {altitude}m...")
+
+            # Get MAVSDK drone instance
+            drone = backend.drone
+
+            # Arm the drone
+            print("🔧 Arming drone...")
+            await drone.action.arm()
+
+            # Set takeoff altitude
+            await drone.action.set_takeoff_altitude(altitude)
+
+            # Execute takeoff
+            print(f"🚀 Taking off to {altitude}m...")
+            await drone.action.takeoff()
+
+            # Wait for takeoff completion (near target altitude, at most 8s)
+            target_alt = altitude * 0.95
+            reached = await wait_for_telemetry(
+                drone.telemetry.position(),
+                lambda position: position.relative_altitude_m >= target_alt,
+                timeout=8.0,
+            )
+            if not reached:
+                print(f"⏱️  Still climbing to {altitude}m after 8s")
+
+            duration = time.monotonic() - start_time
+
+            print(f"✅ Takeoff completed in {duration:.1f}s")
+            return CommandResult(
+                success=True,
+                message=f"Takeoff to {altitude}m completed successfully",
+                duration=duration,
+            )
+
+        except Exception as e:
+            duration = time.monotonic() - start_time
+            return CommandResult(
+                success=False, message=f"Takeoff failed: {str(e)}", error=str(e), duration=duration
+            )
+
+
+class WaitCommand(BaseCommand):
+    """Wait for specified duration in command sequences.
+
+    Useful for:
+    - Mission timing coordination
+    - Sensor stabilization delays
+    - Formation flight synchronization
+    - Data collection intervals
+
+    Parameters:
+        - duration: Wait time in seconds (float, 0.1 to 300.0)
+        - message: Optional status message to display during wait
+    """
+
+    __slots__ = ()
+
+    def validate_params(self) -> None:
+        """Validate wait command parameters."""
+        params = self.params
+        if "duration" not in params:
+            raise ValueError("wait command requires 'duration' parameter")
+
+        duration = params["duration"]
+
+        if type(duration) not in NUM_TYPES:
+            raise ValueError("duration must be a number")
+
+        if duration < 0.1:
+            raise ValueError("duration must be at least 0.1 seconds")
+
+        if duration > 300.0:
+            raise ValueError("duration must not exceed 300 seconds (5 minutes)")
+
+        # Validate optional message parameter
+        if "message" in params:
+            message = params["message"]
+            if type(message) is not str:
+                raise ValueError("message must be a string")
+            if len(message) > 100:
+                raise ValueError("message must not exceed 100 characters")
+
+    async def execute(self, backend) -> CommandResult:
+        """Execute wait command with precise timing."""
+        start_time = time.monotonic()
+
+        try:
+            params = self.params
+            duration = params["duration"]
+            custom_message = params.get("message", "")
+
+            if custom_message:
+                print(f"⏱️  Waiting {duration}s: {custom_message}")
+            else:
+                print(f"⏱️  Waiting {duration} seconds...")
+
+            # Perform the wait using asyncio.sleep for precise timing
+            await asyncio.sleep(duration)
+
+            actual_duration = time.monotonic() - start_time
+            timing_accuracy = abs(actual_duration - duration)
+
+            # Consider timing accurate if within 10ms or 1% of target
+            timing_threshold = max(0.01, duration * 0.01)
+            timing_ok = timing_accuracy <= timing_threshold
+
+            if timing_ok:
+                message = f"wait completed successfully ({actual_duration:.2f}s)"
+            else:
+                message = f"wait completed with timing drift ({actual_duration:.2f}s vs {duration:.2f}s target)"
+
+            return CommandResult(success=True, message=message, duration=actual_duration)
+
+        except Exception as e:
+            actual_duration = time.monotonic() - start_time
+            return CommandResult(
+                success=False,
+                message=f"wait failed: {str(e)}",
+                error=str(e),
+                duration=actual_duration,
+            )
+
+
+class YawCommand(BaseCommand):
+    """Rotate drone to specified heading."""
+
+    __slots__ = ()
+
+    def validate_params(self) -> None:
+        """Validate yaw command parameters."""
+        heading = self.params.get("heading")
+        if heading is None or type(heading) not in NUM_TYPES or not (0 <= heading < 360):
+            raise ValueError("heading must be a number between 0 and 360 degrees")
+        speed = self.params.get("speed", 30.0)
+        if type(speed) not in NUM_TYPES or speed <= 0 or speed > 180:
+            raise ValueError("speed must be a positive number ≤ 180 deg/s")
+
+    async def _check_flight_state(self, backend) -> None:
+        """Check if drone is armed and airborne."""
+        is_armed, relative_altitude = await read_flight_state(backend)
+        if not is_armed:
+            raise RuntimeError("yaw command requires drone to be armed. Use takeoff first.")
+        if relative_altitude < 0.5:
+            raise RuntimeError("yaw command requires drone to be airborne. Use takeoff first.")
+
+    async def execute(self, backend) -> CommandResult:
+        """Execute yaw rotation using MAVSDK set_current_heading."""
+        start_time = time.monotonic()
+        try:
+            if not backend.connected:
+                return CommandResult(
+                    success=False,
+                    message="Backend not connected to drone",
+                    error="backend_disconnected",
+                )
+            await self._check_flight_state(backend)
+            drone = backend.drone
+            heading = self.params["heading"]
+            speed = self.params.get("speed", 30.0)
+            print(f"🔧 Executing yaw to heading {heading}° at speed {speed}°/s")
+            await drone.action.set_current_heading(heading)
+            print("🚁 Yaw command sent, monitoring heading...")
+            # Monitor heading on a single attitude stream until within tolerance
+            timeout = 30.0
+            tolerance = 2.0
+            log_interval = 5.0
+            next_log = time.monotonic()
+            attitudes = drone.telemetry.attitude_euler()
+            try:
+                async with asyncio.timeout(timeout):
+                    async for attitude in attitudes:
+                        current_heading = attitude.yaw_deg % 360
+                        diff = abs((current_heading - heading + 180) % 360 - 180)
+                        if diff <= tolerance:
+                            duration = time.monotonic() - start_time
+                            return CommandResult(
+                                success=True,
+                                message=f"Yaw to {heading}° completed (actual: {current_heading:.1f}°)",
+                                duration=duration,
+                            )
+                        now = time.monotonic()
+                        if now >= next_log:
+                            log.debug("📊 Current heading: %.1f°, Δ=%.1f°", current_heading, diff)
+                            next_log = now + log_interval
+            except TimeoutError:
+                pass
+            finally:
+                await attitudes.aclose()
+            duration = time.monotonic() - start_time
+            return CommandResult(
+                success=False,
+                message=f"Yaw to {heading}° timed out after {timeout}s",
+                error="timeout",
+                duration=duration,
+            )
+        except Exception as e:
+            duration = time.monotonic() - start_time
+            return CommandResult(
+                success=False, message=f"yaw failed: {str(e)}", error=str(e), duration=duration
+            )
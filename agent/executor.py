@@ -5,15 +5,79 @@ Handles command sequence execution with dynamic command loading.
 """
 import asyncio
 import logging
+import os
 import time
-from typing import Any, Dict, List, Optional
+from itertools import groupby
+from operator import attrgetter
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple, Union
 
 from shared.models import Command, CommandMode, CommandResult
 
 from .command_registry import CommandRegistry
 from .commands.rtl import RTLCommand  # Keep for emergency RTL
 
-logger = logging.getLogger(__name__)
+# Child of the API's "dronesphere.agent" logger, so records go through its
+# queued (non-blocking) console handler
+logger = logging.getLogger("dronesphere.agent.executor")
+
+# Commands whose parameter validation is skipped when they come without params
+# (comma-separated override in DRONESPHERE_SKIP_VALIDATION, empty to disable)
+SKIP_VALIDATION = frozenset(
+    name.strip()
+    for name in os.getenv("DRONESPHERE_SKIP_VALIDATION", "wait,land,rtl").split(",")
+    if name.strip()
+)
+
+# Commands that leave the vehicle untouched. Only sequences made up entirely
+# of these are coalesced; anything that flies (takeoff, goto, land, ...) must
+# run once per caller, since two callers asking for a takeoff expect two
+COALESCE_SAFE = frozenset({"wait"})
+
+
+def _is_critical(cmd: Command) -> bool:
+    """Check whether a failure of cmd must trigger emergency RTL.
+
+    Only CRITICAL stops the sequence; CONTINUE and SKIP carry on. Modes
+    are always CommandMode members (CommandModel validates them and
+    Command converts strings on construction), so identity is enough.
+    """
+    return cmd.mode is CommandMode.CRITICAL
+
+
+# Marks the end of a sequence on a submission's results queue
+_END = object()
+
+
+class _Submission:
+    """A queued sequence and the queue its results are streamed through."""
+
+    __slots__ = ("commands", "results", "abandoned")
+
+    def __init__(self, commands: List[Command]):
+        self.commands = commands
+        # CommandResult items, then _END; an exception if the run raised
+        self.results: asyncio.Queue = asyncio.Queue()
+        # Set once the caller stops listening, so an unstarted run is skipped
+        self.abandoned = False
+
+    async def collect(self) -> List[CommandResult]:
+        """Wait for the whole sequence and return its results.
+
+        Returns:
+            List[CommandResult]: Results for each command executed
+
+        Raises:
+            Exception: Whatever the run raised
+        """
+        results = []
+        try:
+            while (item := await self.results.get()) is not _END:
+                if isinstance(item, BaseException):
+                    raise item
+                results.append(item)
+        finally:
+            self.abandoned = True
+        return results
 
 
 class CommandExecutor:
@@ -27,9 +91,16 @@ class CommandExecutor:
         """
         self.backend = backend
         self.registry = CommandRegistry()
-        self.current_sequence = []
+        # RTL holds no per-run state, so one instance serves every emergency
+        self._rtl_command = RTLCommand("rtl", {})
+        self.current_sequence: Tuple[Command, ...] = ()
         self.executing = False
 
+        # Submitted sequences, run one at a time by the worker task (started
+        # on first submission, so the executor can be built outside a loop)
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._worker_task: Optional[asyncio.Task] = None
+
         # Discover and register commands
         self._initialize_commands()
 
@@ -37,134 +108,359 @@ class CommandExecutor:
         """Initialize dynamic command registry."""
         try:
             self.registry.discover_and_register()
-            logger.info(f"🚀 Loaded {len(self.registry.commands)} commands dynamically")
+            logger.info("🚀 Loaded %d commands dynamically", len(self.registry.commands))
+
+            # Pay first-call costs now, before the API starts accepting commands
+            self.registry.warm()
 
             # Verify critical commands are loaded
             critical_commands = ["takeoff", "land", "rtl", "goto", "wait"]
             for cmd in critical_commands:
                 if cmd not in self.registry.commands:
-                    logger.warning(f"⚠️ Critical command '{cmd}' not loaded!")
+                    logger.warning("⚠️ Critical command '%s' not loaded!", cmd)
+
+            # Validators are compiled during discovery; commands without one
+            # run with unchecked parameters, so call them out once here
+            unvalidated = [
+                name for name in self.registry.commands if name not in self.registry.validators
+            ]
+            if unvalidated:
+                logger.warning("⚠️ No compiled validator for: %s", ", ".join(unvalidated))
 
         except Exception as e:
-            logger.error(f"Failed to initialize command registry: {e}")
+            logger.error("Failed to initialize command registry: %s", e)
             # Fall back to empty registry (will fail gracefully on command execution)
 
     async def execute_sequence(self, commands: List[Command]) -> List[CommandResult]:
         """Execute a sequence of commands with proper error handling.
 
+        Concurrent callers are queued and served in order instead of being
+        rejected; identical side-effect-free sequences (see COALESCE_SAFE)
+        waiting together run only once.
+
         Args:
             commands: List of Command objects to execute
 
         Returns:
             List[CommandResult]: Results for each command executed
         """
-        if self.executing:
-            raise RuntimeError("Executor is already running a command sequence")
+        return [result async for result in self.execute_sequence_stream(commands)]
+
+    async def execute_sequence_stream(self, commands: List[Command]) -> AsyncIterator[CommandResult]:
+        """Execute a sequence of commands, yielding each result as it is produced.
+
+        Queued and coalesced like execute_sequence. Closing the iterator
+        early does not stop a sequence that has already started.
+
+        Args:
+            commands: List of Command objects to execute
+
+        Yields:
+            CommandResult: Result of each command executed, in sequence order
+        """
+        submission = self._submit(commands)
+        try:
+            while True:
+                item = await submission.results.get()
+                if item is _END:
+                    return
+                if isinstance(item, BaseException):
+                    raise item
+                yield item
+        finally:
+            submission.abandoned = True
+
+    def _submit(self, commands: List[Command]) -> "_Submission":
+        """Queue a sequence for the worker task.
+
+        Args:
+            commands: List of Command objects to execute
+
+        Returns:
+            _Submission: Receives the sequence results as they are produced
+        """
+        if self._worker_task is None or self._worker_task.done():
+            self._worker_task = asyncio.create_task(self._worker())
+
+        submission = _Submission(commands)
+        self._queue.put_nowait(submission)
+        return submission
+
+    async def _worker(self) -> None:
+        """Run queued sequences one at a time, coalescing identical safe ones.
+
+        Everything already waiting is drained after each wake-up; adjacent
+        entries with equal commands share a single run and its results, but
+        only when every command is in COALESCE_SAFE.
+        """
+        queue = self._queue
+        while True:
+            pending = [await queue.get()]
+            while True:
+                try:
+                    pending.append(queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+
+            while pending:
+                group = [pending.pop(0)]
+                commands = group[0].commands
+                if all(cmd.name in COALESCE_SAFE for cmd in commands):
+                    while pending and pending[0].commands == commands:
+                        group.append(pending.pop(0))
+
+                # Callers that gave up (e.g. a dropped request) need no run;
+                # their results queue is just closed
+                for submission in group:
+                    if submission.abandoned:
+                        submission.results.put_nowait(_END)
+                group = [s for s in group if not s.abandoned]
+                if not group:
+                    continue
+                if len(group) > 1:
+                    logger.info("🔗 Coalesced %d identical command sequences", len(group))
+
+                try:
+                    async for result in self._run_sequence(commands):
+                        for submission in group:
+                            submission.results.put_nowait(result)
+                except Exception as e:
+                    for submission in group:
+                        submission.results.put_nowait(e)
+                    continue
+
+                for submission in group:
+                    submission.results.put_nowait(_END)
+
+    async def _run_sequence(self, commands: List[Command]) -> AsyncIterator[CommandResult]:
+        """Execute one sequence; only ever iterated by the worker task.
+
+        Args:
+            commands: List of Command objects to execute
 
+        Yields:
+            CommandResult: Result of each command executed, as soon as its
+            command (or its parallel group) finishes
+        """
         self.executing = True
-        self.current_sequence = commands.copy()
+        self.current_sequence = tuple(commands)
         results = []
+        total = len(commands)
+        stop = False
 
         try:
-            print(f"🚀 Starting command sequence with {len(commands)} commands")
+            logger.info("🚀 Starting command sequence with %d commands", total)
+
+            position = 0
+            for group_id, members in groupby(commands, key=attrgetter("group")):
+                if group_id is None:
+                    for cmd in members:
+                        position += 1
+                        stop = await self._execute_serial(cmd, position, total, results)
+                        yield results[-1]
+                        if stop:
+                            break
+                else:
+                    members = list(members)
+                    stop = await self._execute_group(members, position, total, results)
+                    for result in results[position:]:
+                        yield result
+                    position += len(members)
 
-            for i, cmd in enumerate(commands):
-                print(f"\n📋 [{i+1}/{len(commands)}] Executing: {cmd.name}")
+                if stop:
+                    break
 
-                # Validate command exists
-                command_class = self.registry.get_command_class(cmd.name)
-                if not command_class:
-                    result = CommandResult(
-                        success=False,
-                        message=f"Unknown command: {cmd.name}",
-                        error="unknown_command",
-                    )
-                    results.append(result)
-
-                    if cmd.mode == CommandMode.CRITICAL:
-                        print("💥 Critical command failed - triggering emergency RTL")
-                        await self._emergency_rtl()
-                        break
-                    elif cmd.mode == CommandMode.ABORT_ON_FAIL:
-                        print("🛑 Command sequence aborted due to failure")
-                        break
-                    else:
-                        print("⚠️  Continuing sequence despite command failure")
+            logger.info("🏁 Command sequence completed. %d commands processed.", len(results))
+
+        finally:
+            self.executing = False
+            self.current_sequence = ()
+
+    async def _execute_serial(
+        self, cmd: Command, position: int, total: int, results: List[CommandResult]
+    ) -> bool:
+        """Execute one command on its own and apply its failure mode.
+
+        Args:
+            cmd: Command to execute
+            position: 1-based position of the command in the sequence
+            total: Number of commands in the sequence
+            results: Sequence results, the command's result is appended
+
+        Returns:
+            bool: True if the sequence must stop
+        """
+        logger.info("📋 [%d/%d] Executing: %s", position, total, cmd.name)
+
+        result = await self._execute_command(cmd)
+        results.append(result)
+
+        if result.success:
+            logger.info("✅ Command %s completed successfully", cmd.name)
+            return False
+
+        logger.warning("⚠️  Command %s failed: %s", cmd.name, result.message)
+        return await self._handle_failure(cmd)
+
+    async def _handle_failure(self, cmd: Command) -> bool:
+        """Apply the command's failure mode after it failed.
+
+        Args:
+            cmd: The failed command
+
+        Returns:
+            bool: True if the sequence must stop
+        """
+        if _is_critical(cmd):
+            logger.error("💥 Critical command %s failed - triggering emergency RTL", cmd.name)
+            await self._emergency_rtl()
+            return True
+
+        logger.warning("⚠️  Continuing sequence despite command failure")
+        return False
+
+    async def _execute_group(
+        self, group: List[Command], position: int, total: int, results: List[CommandResult]
+    ) -> bool:
+        """Execute a parallel group of commands concurrently.
+
+        Results are appended in command order. The first CRITICAL failure
+        cancels the still-running siblings and triggers emergency RTL; other
+        failures let the rest of the group and the sequence carry on.
+
+        Args:
+            group: Consecutive commands sharing a group id
+            position: Number of commands in the sequence before the group
+            total: Number of commands in the sequence
+            results: Sequence results, the group's results are appended
+
+        Returns:
+            bool: True if the sequence must stop
+        """
+        logger.info(
+            "📋 [%d-%d/%d] Executing group %s: %s",
+            position + 1,
+            position + len(group),
+            total,
+            group[0].group,
+            ", ".join(cmd.name for cmd in group),
+        )
+
+        tasks = {asyncio.create_task(self._execute_command(cmd)): cmd for cmd in group}
+        pending = set(tasks)
+        critical_failed = False
+        try:
+            while pending and not critical_failed:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.cancelled():
+                        continue
+                    cmd = tasks[task]
+                    result = task.result()
+                    if result.success:
+                        logger.info("✅ Command %s completed successfully", cmd.name)
                         continue
 
-                # Validate parameters
-                validation_errors = self.registry.validate_params(cmd.name, cmd.params)
-                if validation_errors:
-                    result = CommandResult(
+                    logger.warning("⚠️  Command %s failed: %s", cmd.name, result.message)
+                    if _is_critical(cmd):
+                        critical_failed = True
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+        for task in tasks:
+            if task.cancelled():
+                results.append(
+                    CommandResult(
                         success=False,
-                        message=f"Invalid parameters: {'; '.join(validation_errors)}",
-                        error="invalid_parameters",
+                        message=f"Cancelled after critical failure in group {group[0].group}",
+                        error="cancelled",
                     )
-                    results.append(result)
-
-                    if cmd.mode == CommandMode.CRITICAL:
-                        print("💥 Critical command validation failed - triggering emergency RTL")
-                        await self._emergency_rtl()
-                        break
-                    else:
-                        print("⚠️  Continuing despite validation failure")
-                        continue
-
-                # Execute command
-                try:
-                    command_instance = command_class(cmd.name, cmd.params)
-                    result = await command_instance.execute(self.backend)
-                    results.append(result)
+                )
+            else:
+                results.append(task.result())
 
-                    # Handle failure based on command mode
-                    if not result.success:
-                        print(f"⚠️  Command {cmd.name} failed: {result.message}")
+        if critical_failed:
+            logger.error("💥 Critical command in group failed - triggering emergency RTL")
+            await self._emergency_rtl()
+            return True
+        return False
 
-                        if cmd.mode == CommandMode.CRITICAL:
-                            print("💥 Critical command failed - triggering emergency RTL")
-                            await self._emergency_rtl()
-                            break
-                        elif cmd.mode == CommandMode.ABORT_ON_FAIL:
-                            print("🛑 Command sequence aborted due to failure")
-                            break
-                        else:
-                            print("⚠️  Continuing sequence despite command failure")
-                    else:
-                        print(f"✅ Command {cmd.name} completed successfully")
+    async def _execute_command(self, cmd: Command) -> CommandResult:
+        """Look up, validate and execute one command, reporting any failure as a result.
 
-                except Exception as e:
-                    print(f"💥 Command {cmd.name} threw exception: {str(e)}")
-                    result = CommandResult(
-                        success=False, message=f"Command execution error: {str(e)}", error=str(e)
-                    )
-                    results.append(result)
+        Args:
+            cmd: Command to execute
 
-                    if cmd.mode == CommandMode.CRITICAL:
-                        print("💥 Critical command exception - triggering emergency RTL")
-                        await self._emergency_rtl()
-                        break
-                    elif cmd.mode == CommandMode.ABORT_ON_FAIL:
-                        print("🛑 Command sequence aborted due to exception")
-                        break
-                    else:
-                        print("⚠️  Continuing sequence despite exception")
+        Returns:
+            CommandResult: Result of the command, never raises for command errors
+        """
+        command_class = self.registry.get_command_class(cmd.name)
+        if not command_class:
+            return CommandResult(
+                success=False,
+                message=f"Unknown command: {cmd.name}",
+                error="unknown_command",
+            )
+
+        if cmd.name in SKIP_VALIDATION and not cmd.params:
+            logger.debug("Skipping parameter validation for %s", cmd.name)
+        elif validation_errors := self.registry.validate_params(cmd.name, cmd.params):
+            return CommandResult(
+                success=False,
+                message=f"Invalid parameters: {'; '.join(validation_errors)}",
+                error="invalid_parameters",
+            )
+
+        start_ns = time.perf_counter_ns()
+        try:
+            result = await command_class(cmd.name, cmd.params).execute(self.backend)
+        except Exception as e:
+            logger.error("💥 Command %s threw exception: %s", cmd.name, e)
+            result = CommandResult(
+                success=False, message=f"Command execution error: {str(e)}", error=str(e)
+            )
+
+        # Measured here for every command; duration keeps the command's own
+        # figure when it reports one
+        result.duration_ns = time.perf_counter_ns() - start_ns
+        if result.duration is None:
+            result.duration = result.duration_ns / 1e9
+        return result
+
+    async def execute_batch(
+        self, sequences: List[List[Command]]
+    ) -> List[Union[List[CommandResult], BaseException]]:
+        """Execute several command sequences back to back.
+
+        Sequences run in submission order. Each one succeeds or fails on its
+        own: a sequence whose run raised gets its exception in its slot, and
+        the results of the other sequences are kept.
 
-            print(f"\n🏁 Command sequence completed. {len(results)} commands processed.")
+        Args:
+            sequences: Command sequences to execute, in order
 
-        finally:
-            self.executing = False
-            self.current_sequence = []
+        Returns:
+            Results for each sequence, or the exception its run raised, in
+            the same order
+        """
+        logger.info("📦 Executing batch of %d command sequences", len(sequences))
 
-        return results
+        # Queue them all at once so the worker sees (and can coalesce) the batch
+        submissions = [self._submit(commands) for commands in sequences]
+        return await asyncio.gather(
+            *(submission.collect() for submission in submissions), return_exceptions=True
+        )
 
     async def _emergency_rtl(self):
         """Execute emergency return-to-launch."""
         try:
-            print("🚨 Emergency RTL triggered")
-            rtl_command = RTLCommand("rtl", {})
-            await rtl_command.execute(self.backend)
+            logger.error("🚨 Emergency RTL triggered")
+            await self._rtl_command.execute(self.backend)
         except Exception as e:
-            print(f"💥 Emergency RTL failed: {str(e)}")
+            logger.error("💥 Emergency RTL failed: %s", e)
 
     def get_available_commands(self) -> List[str]:
         """Get list of available command names.
@@ -182,13 +478,14 @@ class CommandExecutor:
         """
         return self.executing
 
-    def get_current_sequence(self) -> List[Command]:
-        """Get copy of current command sequence.
+    def get_current_sequence(self) -> Tuple[Command, ...]:
+        """Get current command sequence.
 
         Returns:
-            List[Command]: Current sequence (empty if not executing)
+            Tuple[Command, ...]: Current sequence (empty if not executing);
+            immutable, so it is returned without copying
         """
-        return self.current_sequence.copy()
+        return self.current_sequence
 
     async def abort_sequence(self) -> bool:
         """Abort current command sequence if running.
@@ -199,9 +496,9 @@ class CommandExecutor:
         if not self.executing:
             return False
 
-        print("🛑 Aborting command sequence...")
+        logger.warning("🛑 Aborting command sequence...")
         self.executing = False
-        self.current_sequence = []
+        self.current_sequence = ()
 
         # Trigger emergency RTL for safety
         await self._emergency_rtl()
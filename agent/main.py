@@ -26,7 +26,18 @@ def main():
     print("📊 Detailed health: http://localhost:8001/health/detailed")
     print("-" * 50)
 
-    uvicorn.run(app, host="0.0.0.0", port=8001, log_level="info", access_log=True)
+    uvicorn.run(
+        app,
+        host="0.0.0.0",
+        port=8001,
+        loop="uvloop",
+        http="httptools",
+        lifespan="on",
+        workers=1,
+        timeout_keep_alive=75,  # Keep polling clients (GCS, orchestrator) on one connection
+        log_level="info",
+        access_log=False,  # Per-request access lines cost more than /ping itself
+    )
 
 
 if __name__ == "__main__":
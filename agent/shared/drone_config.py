@@ -6,54 +6,190 @@ Loads drone definitions from YAML configuration file and provides
 a clean API for accessing drone metadata and connection details.
 """
 
+import copy
+import functools
+import operator
 import os
 import sys
+from collections import defaultdict
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
 
+import orjson
 import yaml
+from pydantic import BaseModel, ConfigDict, Field, ValidationError, computed_field
+
+# Prefer the libyaml C loader, fall back to the pure-Python one
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
 
 # Add project root to path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 
+@functools.lru_cache(maxsize=4)
+def _parse_yaml(path: str, mtime_ns: int) -> Dict[str, Any]:
+    """Parse a YAML file, cached until its modification time changes.
+
+    Only _load_yaml may use the result; it never leaves this module uncopied.
+
+    Args:
+        path: Path to the YAML file
+        mtime_ns: File modification time, part of the cache key only
+
+    Returns:
+        dict: Parsed YAML document
+    """
+    with open(path, 'r') as f:
+        return yaml.load(f, Loader=SafeLoader)
+
+
+def _load_yaml(path: str, mtime_ns: int) -> Dict[str, Any]:
+    """Return a private copy of the cached parse of a YAML file.
+
+    FleetConfig keeps sections of the document and hands them out through
+    to_dict(), so a caller mutating a response must not reach the cache.
+
+    Args:
+        path: Path to the YAML file
+        mtime_ns: File modification time, part of the cache key only
+
+    Returns:
+        dict: Parsed YAML document, owned by the caller
+    """
+    return copy.deepcopy(_parse_yaml(path, mtime_ns))
+
+
+class DroneConnection(BaseModel):
+    """Connection section of a drone definition."""
+
+    model_config = ConfigDict(frozen=True)
+
+    ip: str
+    port: int
+    protocol: str = "http"
+
+    @computed_field
+    @property
+    def endpoint(self) -> str:
+        """Endpoint generated from ip:port."""
+        return f"{self.ip}:{self.port}"
+
+    @computed_field
+    @property
+    def full_url(self) -> str:
+        """Full HTTP endpoint URL."""
+        return f"{self.protocol}://{self.endpoint}"
+
+
+class DroneHardware(BaseModel):
+    """Hardware section of a drone definition (extra keys are kept).
+
+    Every field has a default, so a partial section still loads; unknown
+    limits are None rather than a made-up number.
+    """
+
+    model_config = ConfigDict(frozen=True, extra="allow")
+
+    model: str = "unknown"
+    firmware: str = "unknown"
+    capabilities: List[str] = Field(default_factory=list)
+    max_altitude: Optional[Union[int, float]] = None
+    max_speed: Optional[Union[int, float]] = None
+    battery_capacity: Optional[Union[int, float]] = None
+
+
+class DroneMetadata(BaseModel):
+    """Metadata section of a drone definition (extra keys are kept).
+
+    Every field has a default, so a partial section still loads.
+    """
+
+    model_config = ConfigDict(frozen=True, extra="allow")
+
+    location: str = ""
+    origin_gps: Optional[List[Union[int, float]]] = None
+    team: str = ""
+    priority: str = "normal"
+    notes: str = ""
+
+
+class DroneConfigModel(BaseModel):
+    """Validated drone definition, parsed from drones.yaml in one pass."""
+
+    model_config = ConfigDict(frozen=True)
+
+    id: int
+    name: str
+    description: str = ""
+    type: str
+    status: str
+    connection: DroneConnection
+    hardware: DroneHardware = Field(default_factory=DroneHardware)
+    metadata: DroneMetadata = Field(default_factory=DroneMetadata)
+
+
+def _model_field(path: str) -> property:
+    """Build a read-only property for a (dotted) field of the drone model."""
+    return property(operator.attrgetter("_model." + path))
+
+
+def _model_section(name: str) -> property:
+    """Build a read-only property returning a section of the drone model as a dict.
+
+    The section comes from the cached to_dict() dump, so it carries the same
+    defaults and shares the same objects as to_dict()[name].
+    """
+    return property(lambda self: self.to_dict()[name])
+
+
 class DroneConfig:
     """Represents configuration for a single drone."""
 
+    __slots__ = ("raw_config", "_model", "_dict_cache")
+
     def __init__(self, config_data: Dict[str, Any]):
-        """Initialize drone configuration from dictionary."""
+        """Initialize drone configuration from dictionary.
+
+        Raises:
+            pydantic.ValidationError: If required fields are missing or mistyped
+        """
         self.raw_config = config_data
-        self.id = config_data["id"]
-        self.name = config_data["name"]
-        self.description = config_data["description"]
-        self.type = config_data["type"]
-        self.status = config_data["status"]
-
-        # Connection details
-        self.connection = config_data["connection"]
-        self.ip = self.connection["ip"]
-        self.port = self.connection["port"]
-        self.protocol = self.connection["protocol"]
-        # Auto-generate endpoint from ip:port
-        self.endpoint = f"{self.ip}:{self.port}"
-
-        # Hardware specifications
-        self.hardware = config_data["hardware"]
-        self.model = self.hardware["model"]
-        self.firmware = self.hardware["firmware"]
-        self.capabilities = self.hardware["capabilities"]
-        self.max_altitude = self.hardware["max_altitude"]
-        self.max_speed = self.hardware["max_speed"]
-        self.battery_capacity = self.hardware["battery_capacity"]
-
-        # Metadata
-        self.metadata = config_data["metadata"]
-        self.location = self.metadata["location"]
-        self.origin_gps = self.metadata["origin_gps"]
-        self.team = self.metadata["team"]
-        self.priority = self.metadata["priority"]
-        self.notes = self.metadata["notes"]
+        self._model = DroneConfigModel.model_validate(config_data)
+        self._dict_cache: Optional[Dict[str, Any]] = None
+
+    id = _model_field("id")
+    name = _model_field("name")
+    description = _model_field("description")
+    type = _model_field("type")
+    status = _model_field("status")
+
+    # Connection details (endpoint is generated from ip:port)
+    connection = _model_section("connection")
+    ip = _model_field("connection.ip")
+    port = _model_field("connection.port")
+    protocol = _model_field("connection.protocol")
+    endpoint = _model_field("connection.endpoint")
+
+    # Hardware specifications
+    hardware = _model_section("hardware")
+    model = _model_field("hardware.model")
+    firmware = _model_field("hardware.firmware")
+    capabilities = _model_field("hardware.capabilities")
+    max_altitude = _model_field("hardware.max_altitude")
+    max_speed = _model_field("hardware.max_speed")
+    battery_capacity = _model_field("hardware.battery_capacity")
+
+    # Metadata
+    metadata = _model_section("metadata")
+    location = _model_field("metadata.location")
+    origin_gps = _model_field("metadata.origin_gps")
+    team = _model_field("metadata.team")
+    priority = _model_field("metadata.priority")
+    notes = _model_field("metadata.notes")
 
     @property
     def is_active(self) -> bool:
@@ -73,26 +209,17 @@ class DroneConfig:
     @property
     def full_endpoint(self) -> str:
         """Get full HTTP endpoint URL."""
-        return f"{self.protocol}://{self.endpoint}"
+        return self._model.connection.full_url
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for API responses."""
-        return {
-            "id": self.id,
-            "name": self.name,
-            "description": self.description,
-            "type": self.type,
-            "status": self.status,
-            "connection": {
-                "ip": self.ip,
-                "port": self.port,
-                "protocol": self.protocol,
-                "endpoint": self.endpoint,
-                "full_url": self.full_endpoint,
-            },
-            "hardware": self.hardware,
-            "metadata": self.metadata,
-        }
+        """Convert to dictionary for API responses.
+
+        The model is frozen, so the dict is built once and shared between
+        callers; it must not be mutated.
+        """
+        if self._dict_cache is None:
+            self._dict_cache = self._model.model_dump()
+        return self._dict_cache
 
 
 class FleetConfig:
@@ -110,72 +237,127 @@ class FleetConfig:
         self.config_path = Path(config_path)
         self.config_data = self._load_config()
         self.drones = self._load_drones()
+        self._build_indexes()
 
         # Fleet metadata
-        self.fleet_info = self.config_data["fleet"]
-        self.fleet_name = self.fleet_info["name"]
-        self.fleet_version = self.fleet_info["version"]
-        self.fleet_description = self.fleet_info["description"]
+        self.fleet_info = self.config_data.get("fleet", {})
+        self.fleet_name = self.fleet_info.get("name", "")
+        self.fleet_version = self.fleet_info.get("version", "")
+        self.fleet_description = self.fleet_info.get("description", "")
 
         # Fleet settings
-        self.fleet_settings = self.config_data["fleet_settings"]
-        self.defaults = self.config_data["fleet"]["defaults"]
-        self.environments = self.config_data["environments"]
+        self.fleet_settings = self.config_data.get("fleet_settings", {})
+        self.defaults = self.fleet_info.get("defaults", {})
+        self.environments = self.config_data.get("environments", {})
 
     def _load_config(self) -> Dict[str, Any]:
         """Load configuration from YAML file."""
         try:
-            with open(self.config_path, 'r') as f:
-                return yaml.safe_load(f)
+            path = str(self.config_path)
+            return _load_yaml(path, os.stat(path).st_mtime_ns)
         except FileNotFoundError:
             raise FileNotFoundError(f"Drone configuration file not found: {self.config_path}")
         except yaml.YAMLError as e:
             raise ValueError(f"Invalid YAML in drone configuration: {e}")
 
     def _load_drones(self) -> Dict[int, DroneConfig]:
-        """Load drone configurations."""
+        """Load drone configurations.
+
+        A drone entry that is still missing required fields (e.g. mid-edit
+        during a reload) is skipped with a warning instead of failing the
+        whole fleet.
+        """
         drones = {}
-        for drone_id, drone_data in self.config_data["drones"].items():
-            drone_config = DroneConfig(drone_data)
+        for drone_id, drone_data in (self.config_data.get("drones") or {}).items():
+            try:
+                drone_config = DroneConfig(drone_data)
+            except ValidationError as e:
+                print(f"⚠️  Skipping drone {drone_id}: {e.error_count()} invalid field(s)")
+                continue
             drones[drone_config.id] = drone_config
         return drones
 
+    def _build_indexes(self) -> None:
+        """Precompute the drone lists and registries served by the getters.
+
+        Must be called again whenever self.drones is replaced.
+        """
+        self._active: List[DroneConfig] = []
+        self._simulation: List[DroneConfig] = []
+        self._hardware: List[DroneConfig] = []
+        self._by_team: Dict[str, List[DroneConfig]] = defaultdict(list)
+        self._registry: Dict[int, str] = {}
+        self._active_registry: Dict[int, str] = {}
+
+        # One pass buckets every drone into all of the indexes
+        for drone in self.drones.values():
+            endpoint = drone.endpoint
+            self._registry[drone.id] = endpoint
+            self._by_team[drone.team].append(drone)
+            if drone.is_active:
+                self._active.append(drone)
+                self._active_registry[drone.id] = endpoint
+            if drone.is_simulation:
+                self._simulation.append(drone)
+            if drone.is_hardware:
+                self._hardware.append(drone)
+
     def get_drone(self, drone_id: int) -> Optional[DroneConfig]:
         """Get drone configuration by ID."""
         return self.drones.get(drone_id)
 
     def get_active_drones(self) -> List[DroneConfig]:
         """Get list of active drones."""
-        return [drone for drone in self.drones.values() if drone.is_active]
+        return self._active.copy()
 
     def get_simulation_drones(self) -> List[DroneConfig]:
         """Get list of simulation drones."""
-        return [drone for drone in self.drones.values() if drone.is_simulation]
+        return self._simulation.copy()
 
     def get_hardware_drones(self) -> List[DroneConfig]:
         """Get list of hardware drones."""
-        return [drone for drone in self.drones.values() if drone.is_hardware]
+        return self._hardware.copy()
 
     def get_drones_by_team(self, team: str) -> List[DroneConfig]:
         """Get drones assigned to specific team."""
-        return [drone for drone in self.drones.values() if drone.team == team]
+        return list(self._by_team.get(team, ()))
 
     def get_registry_dict(self) -> Dict[int, str]:
         """Get drone registry in the format expected by server (id: endpoint)."""
-        return {drone.id: drone.endpoint for drone in self.drones.values()}
+        return self._registry.copy()
 
     def get_active_registry_dict(self) -> Dict[int, str]:
         """Get registry for active drones only."""
-        return {drone.id: drone.endpoint for drone in self.get_active_drones()}
+        return self._active_registry.copy()
 
     def reload_config(self) -> None:
         """Reload configuration from file (for dynamic updates)."""
         self.config_data = self._load_config()
         self.drones = self._load_drones()
+        self._build_indexes()
+        # Drop the serialized fleet so the next to_dict() reflects the new file
+        self.__dict__.pop("_fleet_dict", None)
+        self.__dict__.pop("_fleet_json_bytes", None)
         print(f"🔄 Reloaded drone configuration: {len(self.drones)} drones")
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert fleet configuration to dictionary for API responses."""
+        """Convert fleet configuration to dictionary for API responses.
+
+        Built once per load and shared between callers; it must not be mutated.
+        """
+        return self._fleet_dict
+
+    def to_json_bytes(self) -> bytes:
+        """Get the fleet configuration as JSON, serialized once per load.
+
+        Returns:
+            bytes: orjson-encoded to_dict() output
+        """
+        return self._fleet_json_bytes
+
+    @functools.cached_property
+    def _fleet_dict(self) -> Dict[str, Any]:
+        """Fleet configuration dict served by to_dict (cleared on reload)."""
         return {
             "fleet": self.fleet_info,
             "drones": {str(drone_id): drone.to_dict() for drone_id, drone in self.drones.items()},
@@ -183,57 +365,64 @@ class FleetConfig:
             "environments": self.environments,
             "statistics": {
                 "total_drones": len(self.drones),
-                "active_drones": len(self.get_active_drones()),
-                "simulation_drones": len(self.get_simulation_drones()),
-                "hardware_drones": len(self.get_hardware_drones()),
+                "active_drones": len(self._active),
+                "simulation_drones": len(self._simulation),
+                "hardware_drones": len(self._hardware),
             },
         }
 
+    @functools.cached_property
+    def _fleet_json_bytes(self) -> bytes:
+        """Serialized _fleet_dict served by to_json_bytes (cleared on reload)."""
+        return orjson.dumps(self._fleet_dict)
+
 
-# Global fleet configuration instance
-_fleet_config: Optional[FleetConfig] = None
+# Global fleet configuration, loaded once at import; a missing or invalid
+# drones.yaml therefore fails the import instead of the first request
+FLEET: FleetConfig = FleetConfig()
 
 
 def get_fleet_config() -> FleetConfig:
     """Get the global fleet configuration instance."""
-    global _fleet_config
-    if _fleet_config is None:
-        _fleet_config = FleetConfig()
-    return _fleet_config
+    return FLEET
 
 
 def reload_fleet_config() -> FleetConfig:
-    """Reload the global fleet configuration."""
-    global _fleet_config
-    _fleet_config = FleetConfig()
-    return _fleet_config
+    """Reload the global fleet configuration.
+
+    Rebinds FLEET, so callers holding the old instance (e.g. a
+    ``from shared.drone_config import FLEET``) keep the previous config.
+    """
+    global FLEET
+    FLEET = FleetConfig()
+    return FLEET
 
 
 # Convenience functions for common operations
 def get_drone_registry() -> Dict[int, str]:
     """Get drone registry for all drones."""
-    return get_fleet_config().get_registry_dict()
+    return FLEET.get_registry_dict()
 
 
 def get_active_drone_registry() -> Dict[int, str]:
     """Get drone registry for active drones only."""
-    return get_fleet_config().get_active_registry_dict()
+    return FLEET.get_active_registry_dict()
 
 
 def get_drone_info(drone_id: int) -> Optional[Dict[str, Any]]:
     """Get drone information by ID."""
-    drone = get_fleet_config().get_drone(drone_id)
+    drone = FLEET.get_drone(drone_id)
     return drone.to_dict() if drone else None
 
 
 def list_available_drones() -> List[int]:
     """Get list of all available drone IDs."""
-    return list(get_fleet_config().drones.keys())
+    return list(FLEET.drones.keys())
 
 
 def list_active_drones() -> List[int]:
     """Get list of active drone IDs."""
-    return [drone.id for drone in get_fleet_config().get_active_drones()]
+    return [drone.id for drone in FLEET.get_active_drones()]
 
 
 if __name__ == "__main__":
@@ -10,6 +10,8 @@ from dataclasses import dataclass
 from enum import Enum
 from typing import Any, Dict, List, Optional
 
+from pydantic import BaseModel, Field
+
 
 class CommandMode(str, Enum):
     """Execution mode for individual commands.
@@ -17,6 +19,10 @@ class CommandMode(str, Enum):
     - CRITICAL: Failure triggers emergency RTL
     - CONTINUE: Failure continues to next command (default)
     - SKIP: Failure skips to next command
+
+    Values stay strings for the wire format. Command and CommandModel both
+    hold members (plain strings are converted on construction), so hot
+    paths compare them with ``is``.
     """
 
     CRITICAL = "critical"
@@ -35,7 +41,7 @@ class QueueMode(str, Enum):
     APPEND = "append"
 
 
-@dataclass
+@dataclass(slots=True)
 class Command:
     """Individual drone command with parameters and execution mode.
 
@@ -43,14 +49,23 @@ class Command:
         name: Command identifier (e.g., 'takeoff', 'goto', 'land')
         params: Command-specific parameters as key-value pairs
         mode: Execution mode determining failure behavior
+        group: Parallel group id; consecutive commands with the same id run
+            concurrently, None runs the command on its own (default)
     """
 
     name: str
     params: Dict[str, Any]
     mode: CommandMode = CommandMode.CONTINUE
+    group: Optional[int] = None
+
+    def __post_init__(self):
+        # Convert a plain string mode once here, so the executor can test
+        # members by identity alone
+        if type(self.mode) is not CommandMode:
+            self.mode = CommandMode(self.mode)
 
 
-@dataclass
+@dataclass(slots=True)
 class CommandRequest:
     """Complete command request for drone operations.
 
@@ -68,7 +83,32 @@ class CommandRequest:
     target_drone: Optional[int] = None
 
 
-@dataclass
+class CommandModel(BaseModel):
+    """Wire format of a single command in a ``/commands`` request.
+
+    Mirrors :class:`Command` field for field, so the executor can consume
+    instances directly without converting them back to dataclasses.
+    """
+
+    name: str
+    params: Dict[str, Any] = Field(default_factory=dict)
+    mode: CommandMode = CommandMode.CONTINUE
+    group: Optional[int] = None
+
+
+class CommandRequestModel(BaseModel):
+    """Wire format of a ``/commands`` request body.
+
+    Validated and coerced by pydantic-core when bound as a FastAPI endpoint
+    parameter, replacing manual parsing of the raw JSON dict.
+    """
+
+    commands: List[CommandModel]
+    queue_mode: QueueMode = QueueMode.OVERRIDE
+    target_drone: Optional[int] = None
+
+
+@dataclass(slots=True)
 class CommandResult:
     """Result of executing a single command.
 
@@ -77,19 +117,22 @@ class CommandResult:
         message: Human-readable result description
         error: Error identifier for programmatic handling
         duration: Command execution time in seconds
+        duration_ns: Execution time in nanoseconds as measured by the executor
     """
 
     success: bool
     message: str
     error: Optional[str] = None
     duration: Optional[float] = None
+    duration_ns: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TelemetryData:
     """Current drone telemetry information.
 
     Standardized telemetry format across all drone types and backends.
+    Instances are immutable; build a new one per sample.
     """
 
     timestamp: float
@@ -0,0 +1,75 @@
+"""Numeric helpers for telemetry values derived on the agent.
+
+Path: agent/telemetry_math.py
+Functions are compiled with numba when it is installed (cached on disk, so
+only the first run pays the compile cost) and run as plain Python otherwise.
+"""
+import math
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# Mean Earth radius in meters
+EARTH_RADIUS_M = 6371000.0
+
+
+def _jit(func):
+    """Compile func with numba when available, else return it unchanged."""
+    if njit is None:
+        return func
+    return njit(cache=True, fastmath=True)(func)
+
+
+@_jit
+def haversine_rad(lat1_rad: float, lon1_rad: float, lat2_rad: float, lon2_rad: float,
+                  cos_lat2: float) -> float:
+    """Calculate great-circle distance between two points given in radians.
+
+    Callers that measure repeatedly against one fixed point pass its
+    precomputed radians and cosine.
+
+    Args:
+        lat1_rad: Latitude of the first point in radians
+        lon1_rad: Longitude of the first point in radians
+        lat2_rad: Latitude of the second point in radians
+        lon2_rad: Longitude of the second point in radians
+        cos_lat2: Cosine of the second point's latitude
+
+    Returns:
+        float: Distance in meters
+    """
+    sin_dlat = math.sin((lat2_rad - lat1_rad) * 0.5)
+    sin_dlon = math.sin((lon2_rad - lon1_rad) * 0.5)
+    a = sin_dlat * sin_dlat + math.cos(lat1_rad) * cos_lat2 * sin_dlon * sin_dlon
+
+    return 2.0 * EARTH_RADIUS_M * math.asin(math.sqrt(a))
+
+
+@_jit
+def haversine_m(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Calculate great-circle distance between two GPS coordinates.
+
+    Args:
+        lat1: Latitude of the first point in decimal degrees
+        lon1: Longitude of the first point in decimal degrees
+        lat2: Latitude of the second point in decimal degrees
+        lon2: Longitude of the second point in decimal degrees
+
+    Returns:
+        float: Distance in meters
+    """
+    lat2_rad = math.radians(lat2)
+    return haversine_rad(math.radians(lat1), math.radians(lon1),
+                         lat2_rad, math.radians(lon2), math.cos(lat2_rad))
+
+
+def warm() -> None:
+    """Compile the helpers now (a no-op without numba).
+
+    With numba the first call compiles on the calling thread; run this at
+    startup so that does not happen on the event loop mid-request. The
+    arguments are floats, matching the float64 telemetry values.
+    """
+    haversine_m(0.0, 0.0, 0.0, 0.0)
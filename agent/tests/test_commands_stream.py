@@ -0,0 +1,94 @@
+"""Checks that /commands/stream delivers each result as it is produced.
+
+Path: agent/tests/test_commands_stream.py
+Run from the project root: python -m unittest discover -s agent/tests -t .
+"""
+import asyncio
+import os
+import sys
+import unittest
+
+sys.path[:0] = [os.path.dirname(os.path.dirname(os.path.abspath(__file__)))]
+
+import orjson
+
+import agent.api as api
+from shared.models import CommandResult
+
+
+class _Backend:
+    connected = True
+
+
+class _GatedExecutor:
+    """Yields one result, then holds the next until the first is received."""
+
+    def __init__(self, first_received: asyncio.Event):
+        self.first_received = first_received
+
+    async def execute_sequence_stream(self, commands):
+        yield CommandResult(success=True, message="first")
+        await self.first_received.wait()
+        yield CommandResult(success=True, message="last")
+
+
+class CommandsStreamTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.saved = (api.executor, api.backend)
+        self.first_received = asyncio.Event()
+        api.executor = _GatedExecutor(self.first_received)
+        api.backend = _Backend()
+
+    async def asyncTearDown(self):
+        api.executor, api.backend = self.saved
+
+    async def test_first_line_arrives_before_last_command_finishes(self):
+        body = orjson.dumps({"commands": [{"name": "wait"}, {"name": "wait"}]})
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "POST",
+            "scheme": "http",
+            "path": "/commands/stream",
+            "raw_path": b"/commands/stream",
+            "root_path": "",
+            "query_string": b"",
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"accept-encoding", b"gzip"),
+            ],
+            "client": ("127.0.0.1", 1234),
+            "server": ("127.0.0.1", 8001),
+        }
+        requests = [{"type": "http.request", "body": body, "more_body": False}]
+
+        async def receive():
+            if requests:
+                return requests.pop(0)
+            await asyncio.Event().wait()
+
+        start = {}
+        chunks = []
+
+        async def send(message):
+            if message["type"] == "http.response.start":
+                start.update(message)
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+                if b"".join(chunks).endswith(b"\n"):
+                    self.first_received.set()
+
+        # The executor only produces the last result once the first line has
+        # been sent, so a buffered (e.g. gzipped) stream never completes
+        await asyncio.wait_for(api.app(scope, receive, send), timeout=5)
+
+        self.assertEqual(start["status"], 200)
+        headers = dict(start["headers"])
+        self.assertNotIn(b"content-encoding", headers)
+        lines = b"".join(chunks).splitlines()
+        self.assertEqual([orjson.loads(line)["message"] for line in lines], ["first", "last"])
+
+
+if __name__ == "__main__":
+    unittest.main()
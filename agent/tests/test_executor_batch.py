@@ -0,0 +1,44 @@
+"""Checks that one failing sequence in a batch does not affect the others.
+
+Path: agent/tests/test_executor_batch.py
+Run from the project root: python -m unittest discover -s agent/tests -t .
+"""
+import asyncio
+import os
+import sys
+import unittest
+
+sys.path[:0] = [os.path.dirname(os.path.dirname(os.path.abspath(__file__)))]
+
+from agent.executor import CommandExecutor
+from shared.models import Command, CommandResult
+
+
+class ExecuteBatchTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.executor = CommandExecutor(backend=None)
+
+        async def execute_command(cmd):
+            await asyncio.sleep(0)
+            if cmd.name == "explode":
+                raise RuntimeError("sequence blew up")
+            return CommandResult(success=True, message=cmd.name)
+
+        self.executor._execute_command = execute_command
+
+    async def test_failing_sequence_keeps_other_results(self):
+        results = await self.executor.execute_batch(
+            [
+                [Command("first", {})],
+                [Command("explode", {})],
+                [Command("last", {})],
+            ]
+        )
+
+        self.assertEqual([r.message for r in results[0]], ["first"])
+        self.assertIsInstance(results[1], RuntimeError)
+        self.assertEqual([r.message for r in results[2]], ["last"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+"""Checks ordering, coalescing and abandonment in the executor queue.
+
+Path: agent/tests/test_executor_queue.py
+Run from the project root: python -m unittest discover -s agent/tests -t .
+"""
+import asyncio
+import os
+import sys
+import unittest
+
+sys.path[:0] = [os.path.dirname(os.path.dirname(os.path.abspath(__file__)))]
+
+from agent.executor import CommandExecutor
+from shared.models import Command, CommandResult
+
+
+class ExecutorQueueTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.executor = CommandExecutor(backend=None)
+        self.executed = []
+        self.release = asyncio.Event()
+
+        async def execute_command(cmd):
+            # "hold" keeps the worker busy so later submissions pile up
+            if cmd.name == "hold":
+                await self.release.wait()
+            self.executed.append(cmd.name)
+            return CommandResult(success=True, message=cmd.name)
+
+        self.executor._execute_command = execute_command
+
+    async def _queue_behind_hold(self, *sequences):
+        """Submit sequences while a held sequence occupies the worker."""
+        busy = asyncio.create_task(self.executor.execute_sequence([Command("hold", {})]))
+        await asyncio.sleep(0)
+        tasks = [asyncio.create_task(self.executor.execute_sequence(s)) for s in sequences]
+        await asyncio.sleep(0)
+        return busy, tasks
+
+    async def test_sequences_run_in_submission_order(self):
+        busy, tasks = await self._queue_behind_hold(
+            [Command("a", {})], [Command("b", {})], [Command("c", {})]
+        )
+        self.release.set()
+        await asyncio.gather(busy, *tasks)
+
+        self.assertEqual(self.executed, ["hold", "a", "b", "c"])
+
+    async def test_identical_safe_sequences_share_one_run(self):
+        busy, tasks = await self._queue_behind_hold(
+            [Command("wait", {"duration": 1})], [Command("wait", {"duration": 1})]
+        )
+        self.release.set()
+        await busy
+        first, second = await asyncio.gather(*tasks)
+
+        self.assertEqual(self.executed, ["hold", "wait"])
+        self.assertEqual([r.message for r in first], ["wait"])
+        self.assertEqual([r.message for r in second], ["wait"])
+
+    async def test_identical_flight_sequences_each_run(self):
+        mission = [Command("takeoff", {"altitude": 5}), Command("land", {})]
+        busy, tasks = await self._queue_behind_hold(list(mission), list(mission))
+        self.release.set()
+        await asyncio.gather(busy, *tasks)
+
+        self.assertEqual(self.executed, ["hold", "takeoff", "land", "takeoff", "land"])
+
+    async def test_abandoned_submission_is_skipped(self):
+        busy, (dropped, kept) = await self._queue_behind_hold(
+            [Command("dropped", {})], [Command("kept", {})]
+        )
+        dropped.cancel()
+        await asyncio.sleep(0)
+        self.release.set()
+        await busy
+
+        self.assertEqual([r.message for r in await kept], ["kept"])
+        self.assertEqual(self.executed, ["hold", "kept"])
+
+
+if __name__ == "__main__":
+    unittest.main()